@@ -13,9 +13,12 @@ if %ERRORLEVEL% neq 0 (
     echo.
     pause
 )
+rem Same layout as get_executable_path() in build.py
+set "EXE_PATH=release\3D-Print_CostCulator\3D-Print_CostCulator.exe"
+if "%PYINSTALLER_BUILD_ONEFILE%"=="yes" set "EXE_PATH=release\3D-Print_CostCulator.exe"
 echo.
-echo =========================================================================
-echo    Done! 3D-Print-Cost-Culator.exe is located in the "release" folder.
-echo =========================================================================
+echo ============================================================================================
+echo    Done! The application is located at %EXE_PATH%
+echo ============================================================================================
 echo.
 pause
\ No newline at end of file
@@ -2,23 +2,67 @@
 """
 Build configuration script for creating executable
 """
+import importlib.util
 import subprocess
 import sys
 import os
 import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+
+# Modules PyInstaller might not detect automatically
+# (reportlab and PIL are imported lazily in main.py and found by the analyzer)
+HIDDEN_IMPORTS = (
+    "tkinter",
+    "tkinter.ttk",
+    "tkinter.filedialog",
+    "tkinter.messagebox",
+)
+
+# Standard library / reportlab modules the app never uses but that would be bundled
+# (unreferenced third-party packages are never collected, they need no exclude)
+EXCLUDED_MODULES = (
+    "test",
+    "unittest",
+    "pydoc",
+    "doctest",
+    "reportlab.graphics.testshapes",
+)
+
+
+@lru_cache(maxsize=256)
+def _exists(path):
+    """Cached os.path.exists for static pre-flight inputs (icon, sources), never for build output"""
+    return os.path.exists(path)
+
 
 def install_pyinstaller():
     """Install PyInstaller if not already installed"""
-    try:
-        import PyInstaller
+    # find_spec only locates the package, importing it would execute PyInstaller's code
+    if importlib.util.find_spec("PyInstaller") is not None:
         print("✓ PyInstaller already installed")
-    except ImportError:
-        print("Installing PyInstaller...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
-        print("✓ PyInstaller installed")
+        return
+    
+    print("Installing PyInstaller...")
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "--disable-pip-version-check", "pyinstaller"])
+    print("✓ PyInstaller installed")
+
+def is_onefile_build():
+    """Onedir is the default; set PYINSTALLER_BUILD_ONEFILE=yes for a single-file build"""
+    return os.environ.get("PYINSTALLER_BUILD_ONEFILE") == "yes"
+
+def get_executable_path(onefile):
+    """Returns the path of the built executable for the selected bundle mode"""
+    if onefile:
+        return "release/3D-Print_CostCulator.exe"
+    return "release/3D-Print_CostCulator/3D-Print_CostCulator.exe"
 
 def create_executable():
     """Create the executable using PyInstaller"""
+    # Private PyInstaller cache per build, parallel builds must not share ~/.pyinstaller
+    os.environ["PYINSTALLER_CONFIG_DIR"] = tempfile.mkdtemp(prefix="pyi_cfg_")
+    
     # Get the current working directory for absolute paths
     project_root = os.getcwd()
     src_path = os.path.join(project_root, "src")
@@ -27,16 +71,25 @@ def create_executable():
     language_manager_path = os.path.join(src_path, "language_manager.py")
     icon_path = os.path.join(project_root, "assets", "icon.ico")
     
-    # Verify required files exist
-    if not os.path.exists(main_py_path):
+    # Onedir avoids unpacking the whole bundle to a temp folder on every launch
+    onefile = is_onefile_build()
+    
+    # Verify required files exist (one directory listing instead of a stat per file)
+    try:
+        with os.scandir(src_path) as it:
+            src_entries = {entry.name: entry for entry in it}
+    except FileNotFoundError:
+        src_entries = {}
+    
+    if "main.py" not in src_entries:
         print(f"❌ Error: main.py not found at {main_py_path}")
         return False
     
-    if not os.path.exists(translations_path):
+    if "translations" not in src_entries:
         print(f"❌ Error: translations folder not found at {translations_path}")
         return False
     
-    if not os.path.exists(language_manager_path):
+    if "language_manager.py" not in src_entries:
         print(f"❌ Error: language_manager.py not found at {language_manager_path}")
         return False
     
@@ -45,67 +98,42 @@ def create_executable():
     print(f"✓ Found language_manager.py at: {language_manager_path}")
     
     # Check for icon file (optional)
-    has_icon = os.path.exists(icon_path)
+    has_icon = _exists(icon_path)
     if has_icon:
         print(f"✓ Found icon at: {icon_path}")
     else:
         print(f"⚠️  No icon found at: {icon_path} (using default)")
     
-    # PyInstaller command with all necessary options
-    cmd = [
-        sys.executable, "-m", "PyInstaller",  # Use python -m PyInstaller instead of direct pyinstaller
-        "--onefile",                    # Single executable file
+    assets_path = os.path.join(project_root, "assets")
+    
+    # PyInstaller options in one list, None entries are dropped
+    options = [
+        "--onefile" if onefile else None,  # Onedir unless a single file is requested
         "--windowed",                   # No console window (GUI app)
+        "--noupx",                      # Never UPX-compress, it slows down build and launch
+        "--noconfirm",                  # Overwrite a previous build without asking
         "--name=3D-Print_CostCulator",  # Name of the executable
         "--distpath=release",           # Output directory
         "--workpath=build_temp",        # Temporary build directory
         "--specpath=build_config",      # Spec file location
-    ]
-    
-    # Add icon if available
-    if has_icon:
-        cmd.append(f"--icon={icon_path}")
+        f"--icon={icon_path}" if has_icon else None,
         
-        # Add all other options
-        cmd.extend([
         # Include hidden imports that might not be detected automatically
-        "--hidden-import=tkinter",
-        "--hidden-import=tkinter.ttk",
-        "--hidden-import=tkinter.filedialog",
-        "--hidden-import=tkinter.messagebox",
-        "--hidden-import=reportlab",
-        "--hidden-import=reportlab.lib",
-        "--hidden-import=reportlab.platypus",
-        "--hidden-import=reportlab.lib.pagesizes",
-        "--hidden-import=reportlab.lib.styles",
-        "--hidden-import=reportlab.lib.units",
-        "--hidden-import=reportlab.lib.colors",
-        
-        # Include PIL for icon support
-        "--hidden-import=PIL",
-        "--hidden-import=PIL.Image",
-        "--hidden-import=PIL.ImageTk",
+        *[f"--hidden-import={module}" for module in HIDDEN_IMPORTS],
         
         # Include data files with absolute paths
         f"--add-data={translations_path};translations",
         f"--add-data={language_manager_path};.",
-    ])
-    
-    # Add icon as data file if it exists
-    if has_icon:
-        assets_path = os.path.join(project_root, "assets")
-        cmd.append(f"--add-data={assets_path};assets")
-    
-    # Add exclude modules and main file
-    cmd.extend([
+        f"--add-data={assets_path};assets" if has_icon else None,
+        
         # Exclude unnecessary modules to reduce size
-        "--exclude-module=matplotlib",
-        "--exclude-module=numpy",
-        "--exclude-module=scipy",
-        "--exclude-module=pandas",
+        *[f"--exclude-module={module}" for module in EXCLUDED_MODULES],
         
         main_py_path  # Use full path to main.py in src folder
-    ])
+    ]
+    
+    # Use python -m PyInstaller instead of direct pyinstaller
+    cmd = [sys.executable, "-m", "PyInstaller", *(option for option in options if option)]
     
     print("Building executable...")
     print("Command:", " ".join(cmd))
@@ -113,7 +141,7 @@ def create_executable():
     try:
         subprocess.check_call(cmd)
         print("✓ Executable created successfully!")
-        print("📁 Location: release/3D-Print_CostCulator.exe")
+        print(f"📁 Location: {get_executable_path(onefile)}")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ Build failed: {e}")
@@ -121,16 +149,24 @@ def create_executable():
 
 
 def cleanup_build_folders():
-    """Clean up temporary build folders"""
-    folders_to_clean = ["build_temp", "build_config"]
+    """Clean up temporary build folders (release/ is always preserved)"""
+    # Not _exists: the script itself creates and removes these, a cached answer would go stale
+    folders_to_clean = [folder for folder in ("build_temp", "build_config") if os.path.exists(folder)]
+    
+    # Per-build PyInstaller config dir created by create_executable()
+    config_dir = os.environ.get("PYINSTALLER_CONFIG_DIR")
+    if config_dir and os.path.isdir(config_dir):
+        folders_to_clean.append(config_dir)
+    
+    # Remove the folders in parallel, rmtree mostly waits on file deletions
+    with ThreadPoolExecutor(max_workers=len(folders_to_clean) or 1) as executor:
+        executor.map(partial(shutil.rmtree, ignore_errors=True), folders_to_clean)
     
     for folder in folders_to_clean:
         if os.path.exists(folder):
-            try:
-                shutil.rmtree(folder)
-                print(f"🧹 Cleaned up: {folder}/")
-            except Exception as e:
-                print(f"⚠️  Warning: Could not remove {folder}/: {e}")
+            print(f"⚠️  Warning: Could not remove {folder}/")
+        else:
+            print(f"🧹 Cleaned up: {folder}/")
         
     print("✨ Cleanup completed!")
 
@@ -138,10 +174,11 @@ def cleanup_build_folders():
 def main():
     """Main build process"""
     print("🔨 Building 3D-Print CostCulator executable...")
+    print("📦 Mode: " + ("onefile" if is_onefile_build() else "onedir") + ", UPX compression disabled")
     print("=" * 50)
     
     # Check if we're in the right directory
-    if not os.path.exists("src/main.py"):
+    if not _exists("src/main.py"):
         print("❌ Error: src/main.py not found. Please run this script from the project root.")
         return
     
@@ -152,7 +189,7 @@ def main():
     if create_executable():
         print("\n🎉 Build completed successfully!")
         print("Your executable is ready for distribution:")
-        print("📦 File: release/3D-Print_CostCulator.exe")
+        print(f"📦 File: {get_executable_path(is_onefile_build())}")
         print("💾 Size: ~20-50MB (includes Python + all dependencies)")
         print("🚀 Ready for distribution - no Python installation required!")
         
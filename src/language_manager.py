@@ -8,38 +8,98 @@ Version: 1.0
 """
 
 import json
+import logging
 import os
 import sys
+import weakref
+from functools import lru_cache
 from typing import Dict, Callable, Any
 
+_log = logging.getLogger("language_manager")
+
+
+# Upper bound for cached templates and formatted texts in LanguageManager.t()
+_T_CACHE_LIMIT = 2048
+
+
+@lru_cache(maxsize=256)
+def _exists(path):
+    """Cached os.path.exists, the checked paths do not change while the app runs"""
+    return os.path.exists(path)
+
+
+# PyInstaller stores the bundle folder in _MEIPASS, resolved once at import
+_BASE_PATH = getattr(sys, "_MEIPASS", None) or os.path.abspath(".")
+
 
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
+    return os.path.join(_BASE_PATH, relative_path)
+
+
+class _StrongRef:
+    """Callable like a weakref.ref but holding its callback strongly"""
+    __slots__ = ("callback",)
     
-    return os.path.join(base_path, relative_path)
+    def __init__(self, callback: Callable):
+        self.callback = callback
+    
+    def __call__(self) -> Callable:
+        return self.callback
+    
+    def __eq__(self, other):
+        return isinstance(other, _StrongRef) and other.callback == self.callback
+    
+    def __hash__(self):
+        return hash(self.callback)
+
+
+def _callback_ref(callback: Callable, on_dead: Callable = None):
+    """Reference to a callback: weak for bound methods (so destroyed GUIs drop out), strong for
+    plain functions and lambdas, which often have no other owner and would die immediately"""
+    if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+        return weakref.WeakMethod(callback, on_dead)
+    return _StrongRef(callback)
+
+
+def _flatten(data: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Flattens nested translation dicts into dotted keys ({"gui": {"title": ..}} -> {"gui.title": ..})"""
+    flat = {}
+    for key, value in data.items():
+        full_key = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, full_key + "."))
+        else:
+            # Interned so repeated labels ("Add", "Remove", ...) share one string object
+            flat[full_key] = sys.intern(value) if isinstance(value, str) else value
+    return flat
 
 
 class LanguageManager:
     """Manages translations and language switching"""
     
+    __slots__ = ("translations_dir", "translations", "current_language",
+                 "update_callbacks", "_t_cache")
+    
     def __init__(self, translations_dir: str = "translations"):
         # Use the resource path function for PyInstaller compatibility
         self.translations_dir = get_resource_path(translations_dir)
+        # Flat per-language maps of dotted keys, e.g. translations["en"]["gui.window_title"]
         self.translations: Dict[str, Dict[str, Any]] = {}
         self.current_language = "de"  # Default: German
-        self.update_callbacks: list[Callable] = []
+        # Ordered set of callback references, bound methods of destroyed widgets drop out on their own
+        self.update_callbacks: Dict[Any, None] = {}
+        # Resolved templates per (language, key) and formatted texts per (language, key, kwargs),
+        # cleared on language/translation changes
+        self._t_cache: Dict[tuple, str] = {}
         
         # Create translations folder if it doesn't exist (development mode)
-        if not os.path.exists(self.translations_dir):
+        if not _exists(self.translations_dir):
             # Try to create the directory only if we're not in a PyInstaller bundle
             try:
                 if not hasattr(sys, '_MEIPASS'):
                     os.makedirs(self.translations_dir)
+                    _exists.cache_clear()
             except OSError:
                 pass  # Ignore if we can't create it (e.g., in PyInstaller bundle)
         
@@ -47,22 +107,20 @@ class LanguageManager:
         self.load_translations()
     
     def load_translations(self):
-        """Loads all available translations"""
+        """Loads all available translations (one <code>.json file per language)"""
+        self._t_cache.clear()
         try:
-            # Load German translation
-            de_path = os.path.join(self.translations_dir, "de.json")
-            if os.path.exists(de_path):
-                with open(de_path, 'r', encoding='utf-8') as f:
-                    self.translations["de"] = json.load(f)
-            
-            # Load English translation
-            en_path = os.path.join(self.translations_dir, "en.json")
-            if os.path.exists(en_path):
-                with open(en_path, 'r', encoding='utf-8') as f:
-                    self.translations["en"] = json.load(f)
-                    
+            with os.scandir(self.translations_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.endswith(".json"):
+                        language_code = entry.name[:-5]
+                        # Binary read: json.loads decodes UTF-8 itself, no text-mode decoder layer
+                        with open(entry.path, 'rb') as f:
+                            self.translations[language_code] = _flatten(json.loads(f.read()))
+        except FileNotFoundError:
+            pass  # No translations folder, t() falls back to showing the keys
         except Exception as e:
-            print(f"Error loading translations: {e}")
+            _log.warning("Error loading translations: %s", e)
     
     def get_available_languages(self) -> Dict[str, str]:
         """Returns available languages"""
@@ -75,9 +133,10 @@ class LanguageManager:
         """Sets the current language"""
         if language_code in self.translations:
             self.current_language = language_code
+            self._t_cache.clear()
             self.notify_update()
         else:
-            print(f"Language '{language_code}' not available")
+            _log.warning("Language %r not available", language_code)
     
     def get_current_language(self) -> str:
         """Returns the current language code"""
@@ -95,64 +154,125 @@ class LanguageManager:
             Translated text or key if not found
         """
         try:
-            # Navigate through nested keys (e.g. "gui.window_title")
-            keys = key.split('.')
-            value = self.translations.get(self.current_language, {})
+            cache_key = (self.current_language, key)
+            template = self._t_cache.get(cache_key)
             
-            for k in keys:
-                if isinstance(value, dict) and k in value:
-                    value = value[k]
+            if template is None:
+                value = self.translations.get(self.current_language, {}).get(key)
+                if value is None:
+                    template = f"[{key}]"  # Show key if not found
                 else:
-                    return f"[{key}]"  # Show key if not found
+                    template = value if isinstance(value, str) else str(value)
+                self._t_cache[cache_key] = template
             
-            # Format string with parameters if provided
-            if isinstance(value, str) and kwargs:
-                return value.format(**kwargs)
+            # Format string with parameters if provided, results are cached per argument set.
+            # Templates without placeholders are returned as-is, str.format would not change them
+            if kwargs and "{" in template:
+                # Argument types are part of the key: 150 and 150.0 (or 1 and True) compare equal but format differently
+                format_key = (cache_key, tuple((name, type(value), value) for name, value in kwargs.items()))
+                try:
+                    text = self._t_cache.get(format_key)
+                except TypeError:
+                    return template.format(**kwargs)  # Unhashable argument, not cacheable
+                if text is None:
+                    if len(self._t_cache) >= _T_CACHE_LIMIT:
+                        self._t_cache.clear()  # Bounded: formatted results vary with live numbers
+                    text = self._t_cache[format_key] = template.format(**kwargs)
+                return text
             
-            return str(value)
+            return template
             
         except Exception as e:
-            print(f"Translation error for '{key}': {e}")
+            _log.warning("Translation error for %r: %s", key, e)
             return f"[{key}]"
     
+    def bulk_t(self, keys) -> list:
+        """Translates several argument-free keys in one call, in the given order"""
+        t = self.t
+        return [t(key) for key in keys]
+    
     def register_update_callback(self, callback: Callable):
-        """Registers a callback function for language changes"""
-        if callback not in self.update_callbacks:
-            self.update_callbacks.append(callback)
+        """Registers a callback function for language changes (bound methods are held by weak reference)"""
+        self.update_callbacks.setdefault(_callback_ref(callback, self._forget_callback), None)
     
     def unregister_update_callback(self, callback: Callable):
         """Removes a callback function"""
-        if callback in self.update_callbacks:
-            self.update_callbacks.remove(callback)
+        self.update_callbacks.pop(_callback_ref(callback), None)
+    
+    def _forget_callback(self, ref: weakref.ref):
+        """Drops the reference of a callback that was garbage collected"""
+        self.update_callbacks.pop(ref, None)
     
     def notify_update(self):
         """Notifies all registered callbacks about language changes"""
-        for callback in self.update_callbacks:
+        # Iterate over a snapshot so callbacks may unregister themselves
+        for ref in tuple(self.update_callbacks):
+            callback = ref()
+            if callback is None:
+                continue
             try:
                 callback()
             except Exception as e:
-                print(f"Error executing update callback: {e}")
+                _log.exception("Error executing update callback: %s", e)
     
     def save_language_preference(self):
-        """Saves the language preference to a configuration file"""
+        """Saves the language preference to a configuration file (only if it changed)"""
+        config_path = "language_config.json"
         try:
+            try:
+                with open(config_path, 'rb') as f:
+                    if json.loads(f.read()).get("language") == self.current_language:
+                        return  # Already saved
+            except (OSError, ValueError, AttributeError):
+                pass  # Missing or unreadable file, write a new one
+            
+            # Write to a temp file and swap it in, so the file is never half-written
             config = {"language": self.current_language}
-            with open("language_config.json", 'w', encoding='utf-8') as f:
+            temp_path = config_path + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
                 json.dump(config, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, config_path)
+            _exists.cache_clear()
         except Exception as e:
-            print(f"Error saving language preference: {e}")
+            _log.warning("Error saving language preference: %s", e)
     
     def load_language_preference(self):
         """Loads the saved language preference"""
         try:
-            if os.path.exists("language_config.json"):
+            if _exists("language_config.json"):
                 with open("language_config.json", 'r', encoding='utf-8') as f:
                     config = json.load(f)
                     if "language" in config and config["language"] in self.translations:
                         self.current_language = config["language"]
         except Exception as e:
-            print(f"Error loading language preference: {e}")
+            _log.warning("Error loading language preference: %s", e)
+
+
+_language_manager = None
+
+
+def get_language_manager() -> LanguageManager:
+    """Returns the global LanguageManager, created (and translations loaded) on first use"""
+    global _language_manager
+    if _language_manager is None:
+        _language_manager = LanguageManager()
+    return _language_manager
+
+
+class _LanguageManagerProxy:
+    """Forwards to the global LanguageManager so importing this module does no file I/O"""
+    
+    __slots__ = ()
+    
+    def __getattr__(self, name):
+        return getattr(get_language_manager(), name)
+    
+    def __setattr__(self, name, value):
+        setattr(get_language_manager(), name, value)
+    
+    def __delattr__(self, name):
+        delattr(get_language_manager(), name)
 
 
-# Global instance of the LanguageManager
-language_manager = LanguageManager()
\ No newline at end of file
+# Global instance of the LanguageManager (constructed lazily)
+language_manager = _LanguageManagerProxy()
\ No newline at end of file
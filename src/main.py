@@ -10,60 +10,86 @@ Version: 1.0
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import concurrent.futures
+import importlib.util
 import json
 import os
+import re
+import subprocess
 import sys
+import webbrowser
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from decimal import Decimal
+from functools import lru_cache
+from dataclasses import dataclass, asdict, field, fields
+from operator import itemgetter
 from typing import Optional, Dict, Any
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib.units import cm
-from reportlab.lib import colors
-
-# Optional PIL import for icon support
-try:
-    from PIL import Image, ImageTk
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
 
 # Import LanguageManager
-from language_manager import language_manager
+from language_manager import language_manager, get_language_manager
+
+# Asset folder, resolved once: PyInstaller bundle (_MEIPASS) or the project root when run as script
+ASSET_DIR = os.path.join(
+    getattr(sys, "_MEIPASS", None) or os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "assets"
+)
 
+# Optional PIL support for the app icon, detected without importing it
+PIL_AVAILABLE = importlib.util.find_spec("PIL") is not None
 
-@dataclass
+
+def _load_pil():
+    """Imports PIL on first use and returns the Image and ImageTk modules"""
+    from PIL import Image, ImageTk
+    return Image, ImageTk
+
+
+@dataclass(slots=True, frozen=True)
 class FilamentType:
     """Data class for a filament type"""
     name: str
     cost_per_kg: float
     
+    _str: str = field(init=False, repr=False, compare=False)  # Display text, built once
+    
+    def __post_init__(self):
+        object.__setattr__(self, '_str', f"{self.name} ({self.cost_per_kg:.2f} €/kg)")
+    
     def __str__(self):
-        return f"{self.name} ({self.cost_per_kg:.2f} €/kg)"
+        return self._str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PrinterType:
     """Data class for a printer type"""
     name: str
     power: float  # Watts
     
+    _str: str = field(init=False, repr=False, compare=False)  # Display text, built once
+    
+    def __post_init__(self):
+        object.__setattr__(self, '_str', f"{self.name} ({self.power:.0f}W)")
+    
     def __str__(self):
-        return f"{self.name} ({self.power:.0f}W)"
+        return self._str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DryerType:
     """Data class for a dryer type"""
     name: str
     power: float  # Watts
     
+    _str: str = field(init=False, repr=False, compare=False)  # Display text, built once
+    
+    def __post_init__(self):
+        object.__setattr__(self, '_str', f"{self.name} ({self.power:.0f}W)")
+    
     def __str__(self):
-        return f"{self.name} ({self.power:.0f}W)"
+        return self._str
 
 
-@dataclass
+@dataclass(slots=True)
 class PrintProject:
     """Data class for a 3D printing project"""
     project_name: str = ""
@@ -104,22 +130,81 @@ class PrintProject:
     modified_date: str = ""
 
 
+def _calc_filament(amount_g: float, cost_per_kg: float) -> float:
+    """Filament cost kernel - amount_g is already the total amount for all models"""
+    if amount_g <= 0 or cost_per_kg <= 0:
+        return 0.0
+    return (amount_g / 1000) * cost_per_kg
+
+
+def _calc_electricity(power_watts: float, duration_hours: float, cost_per_kwh: float) -> float:
+    """Electricity cost kernel for a single device"""
+    if power_watts <= 0 or duration_hours <= 0 or cost_per_kwh <= 0:
+        return 0.0
+    return (power_watts / 1000) * duration_hours * cost_per_kwh
+
+
+# Wear rates
+MECHANICAL_WEAR_RATE = 0.0001  # 0.01% of filament costs per gram (hotend, extruder, etc.)
+TIME_WEAR_RATE = 0.05  # Euro per hour of print time (motors, fans, bearings, etc.)
+ELECTRONIC_WEAR_RATE = 0.005  # 0.5% of electricity costs
+
+
+def _calc_wear(filament_amount: float, print_duration: float,
+               filament_cost: float, electricity_cost: float) -> tuple:
+    """Wear cost kernel, returns (total_wear_cost, mechanical_wear, time_wear, electronic_wear)"""
+    # Negative or zero inputs contribute no wear
+    mechanical_wear = filament_cost * MECHANICAL_WEAR_RATE * (filament_amount if filament_amount > 0 else 0.0)
+    time_wear = (print_duration if print_duration > 0 else 0.0) * TIME_WEAR_RATE
+    electronic_wear = (electricity_cost if electricity_cost > 0 else 0.0) * ELECTRONIC_WEAR_RATE
+    
+    return mechanical_wear + time_wear + electronic_wear, mechanical_wear, time_wear, electronic_wear
+
+
+@lru_cache(maxsize=128)
+def _cost_totals(filament_amount: float, filament_cost_per_kg: float, printer_power: float,
+                 print_duration: float, electricity_cost: float, dryer_enabled: bool,
+                 dryer_power: float) -> tuple:
+    """All project costs for one set of inputs, returned in PrintProject result field order"""
+    # Filament costs
+    filament_cost = _calc_filament(filament_amount, filament_cost_per_kg)
+    
+    # Printer electricity costs
+    electricity_cost_printer = _calc_electricity(printer_power, print_duration, electricity_cost)
+    
+    # Dryer electricity costs (optional)
+    if dryer_enabled:
+        electricity_cost_dryer = _calc_electricity(dryer_power, print_duration, electricity_cost)
+    else:
+        electricity_cost_dryer = 0.0
+    
+    # Base costs (Material + electricity)
+    base_cost = filament_cost + electricity_cost_printer + electricity_cost_dryer
+    
+    # Automatic wear costs based on filament consumption and print time
+    wear_cost, mechanical_wear, time_wear, electronic_wear = _calc_wear(
+        filament_amount,
+        print_duration,
+        filament_cost,
+        electricity_cost_printer + electricity_cost_dryer
+    )
+    
+    return (filament_cost, electricity_cost_printer, electricity_cost_dryer,
+            wear_cost, mechanical_wear, time_wear, electronic_wear, base_cost + wear_cost)
+
+
 class CostCulator:
     """Class for cost calculations"""
     
     @staticmethod
     def calculate_filament_cost(amount_g: float, cost_per_kg: float, model_count: int) -> float:
         """Calculates filament cost - amount_g is already the total amount for all models"""
-        if amount_g <= 0 or cost_per_kg <= 0:
-            return 0.0
-        return (amount_g / 1000) * cost_per_kg
+        return _calc_filament(amount_g, cost_per_kg)
     
     @staticmethod
     def calculate_electricity_cost(power_watts: float, duration_hours: float, cost_per_kwh: float) -> float:
         """Calculates electricity costs for a device"""
-        if power_watts <= 0 or duration_hours <= 0 or cost_per_kwh <= 0:
-            return 0.0
-        return (power_watts / 1000) * duration_hours * cost_per_kwh
+        return _calc_electricity(power_watts, duration_hours, cost_per_kwh)
     
     @staticmethod
     def calculate_wear_cost(base_cost: float, wear_percent: float) -> float:
@@ -141,261 +226,238 @@ class CostCulator:
         Returns:
             tuple: (total_wear_cost, mechanical_wear, time_wear, electronic_wear)
         """
-        mechanical_wear = 0.0
-        time_wear = 0.0
-        electronic_wear = 0.0
-        
-        # Mechanical wear based on filament consumption (hotend, extruder, etc.)
-        if filament_amount > 0:
-            # 0.01% of filament costs per gram as wear
-            mechanical_wear = filament_cost * 0.0001 * filament_amount
-        
-        # Time-based wear (motors, fans, bearings, etc.)
-        if print_duration > 0:
-            # 0.05 Euro per hour of print time as flat rate for time-based wear
-            time_wear = print_duration * 0.05
-        
-        # Electronic wear based on power consumption
-        if electricity_cost > 0:
-            # 0.5% of electricity costs as electronic wear
-            electronic_wear = electricity_cost * 0.005
-        
-        total_wear_cost = mechanical_wear + time_wear + electronic_wear
-        return total_wear_cost, mechanical_wear, time_wear, electronic_wear
+        return _calc_wear(filament_amount, print_duration, filament_cost, electricity_cost)
     
     @classmethod
     def calculate_total_costs(cls, project: PrintProject) -> PrintProject:
         """Calculates all costs for a project"""
-        # Filament costs
-        project.filament_cost = cls.calculate_filament_cost(
+        # Identical inputs (repeated UI recalculations) are served from the cache
+        (project.filament_cost, project.electricity_cost_printer, project.electricity_cost_dryer,
+         project.wear_cost, project.mechanical_wear_cost, project.time_wear_cost,
+         project.electronic_wear_cost, project.total_cost) = _cost_totals(
             project.filament_amount,
             project.filament_cost_per_kg,
-            project.model_count
-        )
-        
-        # Printer electricity costs
-        project.electricity_cost_printer = cls.calculate_electricity_cost(
             project.printer_power,
             project.print_duration,
-            project.electricity_cost
-        )
-        
-        # Dryer electricity costs (optional)
-        if project.dryer_enabled:
-            project.electricity_cost_dryer = cls.calculate_electricity_cost(
-                project.dryer_power,
-                project.print_duration,
-                project.electricity_cost
-            )
-        else:
-            project.electricity_cost_dryer = 0.0
-        
-        # Base costs (Material + electricity)
-        base_cost = project.filament_cost + project.electricity_cost_printer + project.electricity_cost_dryer
-        
-        # Automatic wear costs based on filament consumption and print time
-        wear_result = cls.calculate_automatic_wear_cost(
-            project.filament_amount,
-            project.print_duration,
-            project.filament_cost,
-            project.electricity_cost_printer + project.electricity_cost_dryer
+            project.electricity_cost,
+            project.dryer_enabled,
+            project.dryer_power
         )
         
-        project.wear_cost, project.mechanical_wear_cost, project.time_wear_cost, project.electronic_wear_cost = wear_result
-        
-        # Total costs
-        project.total_cost = base_cost + project.wear_cost
+        return project
+    
+    @staticmethod
+    def clear_results(project: PrintProject) -> PrintProject:
+        """Resets all calculated values of a project, e.g. when its input is invalid"""
+        (project.filament_cost, project.electricity_cost_printer, project.electricity_cost_dryer,
+         project.wear_cost, project.mechanical_wear_cost, project.time_wear_cost,
+         project.electronic_wear_cost, project.total_cost) = (0.0,) * 8
         
         return project
 
 
-class FilamentManager:
-    """Class for managing filament types"""
+def _read_json(path: str):
+    """Reads a JSON file with one binary read, json.loads decodes the UTF-8 itself"""
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+
+def _write_json(path: str, data):
+    """Writes data as indented UTF-8 JSON atomically (temp file + os.replace), a crash never leaves a partial file"""
+    temp_path = path + ".tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(json.dumps(data, indent=4, ensure_ascii=False).encode('utf-8'))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+@lru_cache(maxsize=None)
+def _field_names(item_cls) -> tuple:
+    """Names of the fields stored in JSON, derived fields (init=False) are skipped"""
+    return tuple(item_field.name for item_field in fields(item_cls) if item_field.init)
+
+
+@lru_cache(maxsize=None)
+def _row_getter(item_cls):
+    """Returns a getter yielding a JSON row's values as a tuple in item_cls field order (positional construction)"""
+    names = _field_names(item_cls)
+    if len(names) == 1:
+        # itemgetter with a single key returns the bare value, not a 1-tuple
+        name = names[0]
+        return lambda row: (row[name],)
+    return itemgetter(*names)
+
+
+def _item_row(item) -> dict:
+    """Converts a catalog item to its JSON row, without derived fields"""
+    return {name: getattr(item, name) for name in _field_names(type(item))}
+
+
+# Parsed catalog files: path -> (mtime_ns, size, items)
+_CATALOG_CACHE: Dict[str, tuple] = {}
+
+
+def _load_catalog(path: str, item_cls) -> list:
+    """Loads a JSON catalog file as a list of item_cls, re-parsing only if the file changed"""
+    stat = os.stat(path)
+    cached = _CATALOG_CACHE.get(path)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return list(cached[2])
+    
+    row_values = _row_getter(item_cls)
+    items = [item_cls(*row_values(row)) for row in _read_json(path)]
+    _CATALOG_CACHE[path] = (stat.st_mtime_ns, stat.st_size, items)
+    return list(items)
+
+
+def _remember_catalog(path: str, items: list):
+    """Stores just-saved catalog items so the next load skips reading the file"""
+    stat = os.stat(path)
+    _CATALOG_CACHE[path] = (stat.st_mtime_ns, stat.st_size, list(items))
+
+
+class _NamedCatalog:
+    """Base class for the JSON-backed catalogs of named items (filaments, printers, dryers)"""
+    
+    item_cls = None
+    catalog_file = ""
+    label = ""
+    defaults = ()  # Items used if the file doesn't exist (frozen dataclasses, safe to share)
     
     def __init__(self):
-        self.filaments_file = "filaments.json"
-        self.filaments = self.load_filaments()
+        self.items = self.load_items()
+        self._rebuild_index()
     
-    def load_filaments(self) -> list[FilamentType]:
-        """Loads the filament list from the JSON file"""
+    def _rebuild_index(self):
+        """Rebuilds the name lookups (exact and case-insensitive) and the cached name tuple
+        
+        A hand-edited file may repeat a name, the first item with it wins (as in the file order).
+        """
+        self._by_name = {}
+        self._by_name_ci = {}
+        for item in self.items:
+            self._by_name.setdefault(item.name, item)
+            self._by_name_ci.setdefault(item.name.lower(), item)
+        self._names = tuple(self._by_name)
+    
+    def load_items(self) -> list:
+        """Loads the item list from the JSON file"""
         try:
-            if os.path.exists(self.filaments_file):
-                with open(self.filaments_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return [FilamentType(**item) for item in data]
+            if os.path.exists(self.catalog_file):
+                return _load_catalog(self.catalog_file, self.item_cls)
         except Exception as e:
-            print(f"Error loading filaments: {e}")
+            print(f"Error loading {self.label}s: {e}")
         
-    # Default filaments if file doesn't exist
-        return [
-            FilamentType("eSun PLA+ Black", 16.99),
-        ]
+        return list(self.defaults)
     
-    def save_filaments(self) -> bool:
-        """Saves the filament list to the JSON file"""
+    def save_items(self) -> bool:
+        """Saves the item list to the JSON file"""
         try:
-            data = [asdict(filament) for filament in self.filaments]
-            with open(self.filaments_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
+            data = [_item_row(item) for item in self.items]
+            _write_json(self.catalog_file, data)
+            _remember_catalog(self.catalog_file, self.items)
             return True
         except Exception as e:
-            print(f"Error saving filaments: {e}")
+            print(f"Error saving {self.label}s: {e}")
             return False
     
-    def add_filament(self, name: str, cost_per_kg: float) -> bool:
-        """Adds a new filament"""
-        # Check if filament already exists
-        for filament in self.filaments:
-            if filament.name.lower() == name.lower():
-                return False  # Already exists
-        
-        self.filaments.append(FilamentType(name, cost_per_kg))
-        return self.save_filaments()
-    
-    def get_filament_by_name(self, name: str) -> Optional[FilamentType]:
-        """Finds a filament by name"""
-        for filament in self.filaments:
-            if filament.name == name:
-                return filament
-        return None
+    def add_item(self, item) -> bool:
+        """Adds a new item, names are unique case-insensitively"""
+        key = item.name.lower()
+        if key in self._by_name_ci:
+            return False  # Already exists
+        
+        self.items.append(item)
+        self._by_name[item.name] = item
+        self._by_name_ci[key] = item
+        self._names += (item.name,)
+        return self.save_items()
+    
+    def get_by_name(self, name: str):
+        """Finds an item by name"""
+        return self._by_name.get(name)
+    
+    def get_names(self) -> tuple[str, ...]:
+        """Returns a tuple of all item names (cached, rebuilt only on changes)"""
+        return self._names
+    
+    def remove_item(self, name: str) -> bool:
+        """Removes an item by name"""
+        item = self._by_name.get(name)
+        if item is None:
+            return False  # Item not found
+        
+        self.items.remove(item)  # List keeps the saved order
+        # Rebuilt from the list rather than patched: a duplicate of the name becomes visible again
+        self._rebuild_index()
+        return self.save_items()
+
+
+class FilamentManager(_NamedCatalog):
+    """Class for managing filament types"""
     
-    def get_filament_names(self) -> list[str]:
-        """Returns a list of all filament names"""
-        return [filament.name for filament in self.filaments]
+    item_cls = FilamentType
+    catalog_file = "filaments.json"
+    label = "filament"
+    defaults = (
+        FilamentType("eSun PLA+ Black", 16.99),
+    )
     
-    def remove_filament(self, name: str) -> bool:
-        """Removes a filament by name"""
-        for i, filament in enumerate(self.filaments):
-            if filament.name == name:
-                self.filaments.pop(i)
-                return self.save_filaments()
-        return False  # Filament not found
+    filaments = property(lambda self: self.items)
+    load_filaments = _NamedCatalog.load_items
+    save_filaments = _NamedCatalog.save_items
+    get_filament_by_name = _NamedCatalog.get_by_name
+    get_filament_names = _NamedCatalog.get_names
+    remove_filament = _NamedCatalog.remove_item
+    
+    def add_filament(self, name: str, cost_per_kg: float) -> bool:
+        """Adds a new filament"""
+        return self.add_item(FilamentType(name, cost_per_kg))
 
 
-class PrinterManager:
+class PrinterManager(_NamedCatalog):
     """Class for managing printer types"""
     
-    def __init__(self):
-        self.printers_file = "printers.json"
-        self.printers = self.load_printers()
-    
-    def load_printers(self) -> list[PrinterType]:
-        """Loads the printer list from the JSON file"""
-        try:
-            if os.path.exists(self.printers_file):
-                with open(self.printers_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return [PrinterType(**item) for item in data]
-        except Exception as e:
-            print(f"Error loading printers: {e}")
-        
-    # Default printers if file doesn't exist
-        return [
-            PrinterType("Anycubic i3 Mega S", 150.0)
-        ]
+    item_cls = PrinterType
+    catalog_file = "printers.json"
+    label = "printer"
+    defaults = (
+        PrinterType("Anycubic i3 Mega S", 150.0),
+    )
     
-    def save_printers(self) -> bool:
-        """Saves the printer list to the JSON file"""
-        try:
-            data = [asdict(printer) for printer in self.printers]
-            with open(self.printers_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
-            return True
-        except Exception as e:
-            print(f"Error saving printers: {e}")
-            return False
+    printers = property(lambda self: self.items)
+    load_printers = _NamedCatalog.load_items
+    save_printers = _NamedCatalog.save_items
+    get_printer_by_name = _NamedCatalog.get_by_name
+    get_printer_names = _NamedCatalog.get_names
+    remove_printer = _NamedCatalog.remove_item
     
     def add_printer(self, name: str, power: float) -> bool:
         """Adds a new printer"""
-        # Check if printer already exists
-        for printer in self.printers:
-            if printer.name.lower() == name.lower():
-                return False  # Already exists
-        
-        self.printers.append(PrinterType(name, power))
-        return self.save_printers()
-    
-    def get_printer_by_name(self, name: str) -> Optional[PrinterType]:
-        """Finds a printer by name"""
-        for printer in self.printers:
-            if printer.name == name:
-                return printer
-        return None
-    
-    def get_printer_names(self) -> list[str]:
-        """Returns a list of all printer names"""
-        return [printer.name for printer in self.printers]
-    
-    def remove_printer(self, name: str) -> bool:
-        """Removes a printer by name"""
-        for i, printer in enumerate(self.printers):
-            if printer.name == name:
-                self.printers.pop(i)
-                return self.save_printers()
-        return False  # Printer not found
+        return self.add_item(PrinterType(name, power))
 
 
-class DryerManager:
+class DryerManager(_NamedCatalog):
     """Class for managing dryer types"""
     
-    def __init__(self):
-        self.dryers_file = "dryers.json"
-        self.dryers = self.load_dryers()
-    
-    def load_dryers(self) -> list[DryerType]:
-        """Loads the dryer list from the JSON file"""
-        try:
-            if os.path.exists(self.dryers_file):
-                with open(self.dryers_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return [DryerType(**item) for item in data]
-        except Exception as e:
-            print(f"Error loading dryers: {e}")
-        
-        # Default dryers if file doesn't exist
-        return [
-            DryerType("SUNLU S2", 48.0),
-        ]
+    item_cls = DryerType
+    catalog_file = "dryers.json"
+    label = "dryer"
+    defaults = (
+        DryerType("SUNLU S2", 48.0),
+    )
     
-    def save_dryers(self) -> bool:
-        """Saves the dryer list to the JSON file"""
-        try:
-            data = [asdict(dryer) for dryer in self.dryers]
-            with open(self.dryers_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
-            return True
-        except Exception as e:
-            print(f"Error saving dryers: {e}")
-            return False
+    dryers = property(lambda self: self.items)
+    load_dryers = _NamedCatalog.load_items
+    save_dryers = _NamedCatalog.save_items
+    get_dryer_by_name = _NamedCatalog.get_by_name
+    get_dryer_names = _NamedCatalog.get_names
+    remove_dryer = _NamedCatalog.remove_item
     
     def add_dryer(self, name: str, power: float) -> bool:
         """Adds a new dryer"""
-        # Check if dryer already exists
-        for dryer in self.dryers:
-            if dryer.name.lower() == name.lower():
-                return False  # Already exists
-        
-        self.dryers.append(DryerType(name, power))
-        return self.save_dryers()
-    
-    def get_dryer_by_name(self, name: str) -> Optional[DryerType]:
-        """Finds a dryer by name"""
-        for dryer in self.dryers:
-            if dryer.name == name:
-                return dryer
-        return None
-    
-    def get_dryer_names(self) -> list[str]:
-        """Returns a list of all dryer names"""
-        return [dryer.name for dryer in self.dryers]
-    
-    def remove_dryer(self, name: str) -> bool:
-        """Removes a dryer by name"""
-        for i, dryer in enumerate(self.dryers):
-            if dryer.name == name:
-                self.dryers.pop(i)
-                return self.save_dryers()
-        return False  # Dryer not found
+        return self.add_item(DryerType(name, power))
 
 
 class ProjectManager:
@@ -405,12 +467,11 @@ class ProjectManager:
     def save_project(project: PrintProject, filepath: str) -> bool:
         """Saves a project as a JSON file"""
         try:
-            project.modified_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            project.modified_date = datetime.now().isoformat(sep=' ', timespec='seconds')
             if not project.created_date:
                 project.created_date = project.modified_date
                 
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(asdict(project), f, indent=4, ensure_ascii=False)
+            _write_json(filepath, asdict(project))
             return True
         except Exception as e:
             from language_manager import language_manager
@@ -422,9 +483,7 @@ class ProjectManager:
     def load_project(filepath: str) -> Optional[PrintProject]:
         """Loads a project from a JSON file"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return PrintProject(**data)
+            return PrintProject(**_read_json(filepath))
         except Exception as e:
             from language_manager import language_manager
             messagebox.showerror(language_manager.t("messages.error.title"), 
@@ -432,551 +491,594 @@ class ProjectManager:
             return None
 
 
-class PDFExporter:
-    """Class for PDF export in professional quotation format"""
-    
-    @staticmethod
-    def export_to_pdf(project: PrintProject, filepath: str, language_manager) -> bool:
-        """Exports project results as professional quotation PDF"""
-        try:
-            from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_LEFT
-            from reportlab.lib.styles import ParagraphStyle
-            
-            doc = SimpleDocTemplate(filepath, pagesize=A4, topMargin=1*cm, bottomMargin=1*cm, 
-                                  leftMargin=1*cm, rightMargin=1*cm)
-            story = []
-            styles = getSampleStyleSheet()
-            
-            # Define custom styles (more compact)
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Title'],
-                fontSize=14,
-                alignment=TA_CENTER,
-                spaceAfter=5,
-                textColor=colors.HexColor('#2E4057')
-            )
-            
-            subtitle_style = ParagraphStyle(
-                'CustomSubtitle',
-                parent=styles['Heading2'],
-                fontSize=12,
-                alignment=TA_CENTER,
-                spaceAfter=2,
-                textColor=colors.HexColor('#2E4057'),
-                borderWidth=1,
-                borderColor=colors.HexColor('#2E4057'),
-                borderPadding=5
-            )
-            
-            # TITLE
-            story.append(Paragraph(language_manager.t("pdf.title"), title_style))
-            
-            # PROJECT INFORMATION
-            story.append(Paragraph(language_manager.t("pdf.project_info"), subtitle_style))
-            
-            # Determine correct translation for model count
-            models_text_key = "pdf.parameters.for_models_singular" if project.model_count == 1 else "pdf.parameters.for_models_plural"
-            models_text = language_manager.t(models_text_key, count=project.model_count)
-            dryer_info = language_manager.t("pdf.parameters.not_used") if not project.dryer_enabled else f"{language_manager.t('pdf.parameters.power', power=project.dryer_power)}"
-            
-            project_data = [
-                [language_manager.t("pdf.parameters.parameter"), language_manager.t("pdf.parameters.value"), language_manager.t("pdf.parameters.additional_info")],
-                [language_manager.t("pdf.parameters.project_name"), project.project_name, ''],
-                [language_manager.t("pdf.parameters.model"), project.model_name, ""],
-                [language_manager.t("pdf.parameters.print_duration"), f"{project.print_duration:.1f}h {language_manager.t('pdf.parameters.total_for')}", models_text],
-                [language_manager.t("pdf.parameters.printer"), project.printer_name, language_manager.t("pdf.parameters.power", power=project.printer_power)],
-                [language_manager.t("pdf.parameters.material"), project.filament_name, language_manager.t("pdf.parameters.amount", amount=project.filament_amount, price=project.filament_cost_per_kg)],
-                [language_manager.t("pdf.parameters.dryer"), project.dryer_name if project.dryer_enabled else language_manager.t("pdf.parameters.not_used"), dryer_info],
-                [language_manager.t("pdf.parameters.electricity_rate"), f"{project.electricity_cost:.4f} €/kWh", ''],
-            ]
-            
-            project_table = Table(project_data, colWidths=[4.5*cm, 6*cm, 6.5*cm])
-            project_table.setStyle(TableStyle([
-                # Header
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2E4057')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                
-                # Column spans for project name and model name rows
-                ('SPAN', (1, 1), (2, 1)),  # Project name row spans columns 1-2
-                ('SPAN', (1, 2), (2, 2)),  # Model name row spans columns 1-2
-                
-                # Parameter Column
-                ('BACKGROUND', (0, 1), (0, -1), colors.HexColor('#F8F9FA')),
-                ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 1), (0, -1), 9),
-                ('ALIGN', (0, 1), (0, -1), 'LEFT'),
-                
-                # Value and Additional Info Columns
-                ('FONTSIZE', (1, 1), (-1, -1), 9),
-                ('ALIGN', (1, 1), (1, -1), 'LEFT'),
-                ('ALIGN', (2, 1), (2, -1), 'LEFT'),
-                
-                # General formatting
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#DDDDDD')),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ]))
-            story.append(project_table)
-            story.append(Spacer(1, 0.3*cm))
-            
-            # COST BREAKDOWN
-            story.append(Paragraph(language_manager.t("pdf.cost_breakdown"), subtitle_style))
-            
-            cost_data = [
-                [language_manager.t("pdf.costs.position"), language_manager.t("pdf.costs.calculation"), language_manager.t("pdf.costs.amount")],
-                [language_manager.t("pdf.costs.material_costs"), 
-                 f"{project.filament_amount:.0f}g × {project.filament_cost_per_kg:.2f}€/kg", 
-                 f"{project.filament_cost:.2f} €"],
-                [language_manager.t("pdf.costs.electricity_printer"), 
-                 f"{project.printer_power:.0f}W × {project.print_duration:.1f}h × {project.electricity_cost:.4f}€/kWh", 
-                 f"{project.electricity_cost_printer:.2f} €"],
-            ]
-            
-            if project.dryer_enabled:
-                cost_data.append([language_manager.t("pdf.costs.electricity_dryer"), 
-                                f"{project.dryer_power:.0f}W × {project.print_duration:.1f}h × {project.electricity_cost:.4f}€/kWh", 
-                                f"{project.electricity_cost_dryer:.2f} €"])
-            
-            # Detailed wear cost breakdown
-            cost_data.append([language_manager.t("pdf.costs.wear_maintenance"), 
-                            language_manager.t("pdf.costs.wear_breakdown"), 
-                            f"{project.wear_cost:.2f} €"])
-            
-            cost_data.append([f"  • {language_manager.t('pdf.costs.mechanical_wear')}", 
-                            language_manager.t("pdf.costs.mechanical_wear_calc"), 
-                            f"{project.mechanical_wear_cost:.2f} €"])
-            
-            cost_data.append([f"  • {language_manager.t('pdf.costs.time_wear')}", 
-                            language_manager.t("pdf.costs.time_wear_calc"), 
-                            f"{project.time_wear_cost:.2f} €"])
-            
-            cost_data.append([f"  • {language_manager.t('pdf.costs.electronic_wear')}", 
-                            language_manager.t("pdf.costs.electronic_wear_calc"), 
-                            f"{project.electronic_wear_cost:.2f} €"])
+# PDF footer date (dd.mm.yyyy hh:mm), str.format skips strftime's locale handling
+_FOOTER_DATE_FORMAT = "{0.day:02d}.{0.month:02d}.{0.year} {0.hour:02d}:{0.minute:02d}"
+
+
+@lru_cache(maxsize=None)
+def _pdf_styles() -> Dict[str, Any]:
+    """Builds the PDF paragraph and table styles once, on first export"""
+    from reportlab.platypus import TableStyle
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    
+    styles = getSampleStyleSheet()
+    
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Title'],
+        fontSize=14,
+        alignment=TA_CENTER,
+        spaceAfter=5,
+        textColor=colors.HexColor('#2E4057')
+    )
+    
+    subtitle_style = ParagraphStyle(
+        'CustomSubtitle',
+        parent=styles['Heading2'],
+        fontSize=12,
+        alignment=TA_CENTER,
+        spaceAfter=2,
+        textColor=colors.HexColor('#2E4057'),
+        borderWidth=1,
+        borderColor=colors.HexColor('#2E4057'),
+        borderPadding=5
+    )
+    
+    footer_style = ParagraphStyle(
+        'Footer',
+        parent=styles['Normal'],
+        fontSize=8,
+        alignment=TA_CENTER,
+        textColor=colors.HexColor('#666666'),
+        spaceAfter=0,
+        spaceBefore=0
+    )
+    
+    return {
+        'title': title_style,
+        'subtitle': subtitle_style,
+        'footer': footer_style,
+        'project_table': TableStyle([
+            # Header
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2E4057')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
             
-            cost_table = Table(cost_data, colWidths=[5*cm, 7*cm, 5*cm])
-            cost_table.setStyle(TableStyle([
-                # Header
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2E4057')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                
-                # Cost item column
-                ('BACKGROUND', (0, 1), (0, -1), colors.HexColor('#F8F9FA')),
-                ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 1), (0, -1), 9),
-                ('ALIGN', (0, 1), (0, -1), 'LEFT'),
-                
-                # Calculation and amount columns
-                ('FONTSIZE', (1, 1), (1, -1), 8),
-                ('FONTSIZE', (2, 1), (2, -1), 9),
-                ('FONTNAME', (2, 1), (2, -1), 'Helvetica-Bold'),
-                ('ALIGN', (1, 1), (1, -1), 'LEFT'),
-                ('ALIGN', (2, 1), (2, -1), 'RIGHT'),
-                
-                # General formatting
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#DDDDDD')),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ]))
-            story.append(cost_table)
-            story.append(Spacer(1, 0.3*cm))
+            # Column spans for project name and model name rows
+            ('SPAN', (1, 1), (2, 1)),  # Project name row spans columns 1-2
+            ('SPAN', (1, 2), (2, 2)),  # Model name row spans columns 1-2
             
-            # COST SUMMARY
-            story.append(Paragraph(language_manager.t("pdf.cost_summary"), subtitle_style))
+            # Parameter Column
+            ('BACKGROUND', (0, 1), (0, -1), colors.HexColor('#F8F9FA')),
+            ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 1), (0, -1), 9),
+            ('ALIGN', (0, 1), (0, -1), 'LEFT'),
             
-            total_data = [
-                [language_manager.t("pdf.costs.position"), language_manager.t("pdf.costs.amount"), language_manager.t("pdf.costs.percentage_of_total")],
-                [language_manager.t("pdf.costs.material_costs"), f"{project.filament_cost:.2f} €", f"{(project.filament_cost/project.total_cost*100):.1f}%"],
-                [language_manager.t("pdf.costs.electricity_printer"), f"{project.electricity_cost_printer:.2f} €", f"{(project.electricity_cost_printer/project.total_cost*100):.1f}%"],
-            ]
+            # Value and Additional Info Columns
+            ('FONTSIZE', (1, 1), (-1, -1), 9),
+            ('ALIGN', (1, 1), (1, -1), 'LEFT'),
+            ('ALIGN', (2, 1), (2, -1), 'LEFT'),
             
-            if project.dryer_enabled:
-                total_data.append([language_manager.t("pdf.costs.electricity_dryer"), f"{project.electricity_cost_dryer:.2f} €", f"{(project.electricity_cost_dryer/project.total_cost*100):.1f}%"])
+            # General formatting
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#DDDDDD')),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+        ]),
+        'cost_table': TableStyle([
+            # Header
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2E4057')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
             
-            # Determine unit text for pieces
-            for_x_pieces_text = language_manager.t("units.for_x_pieces", count=project.model_count)
+            # Cost item column
+            ('BACKGROUND', (0, 1), (0, -1), colors.HexColor('#F8F9FA')),
+            ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 1), (0, -1), 9),
+            ('ALIGN', (0, 1), (0, -1), 'LEFT'),
             
-            total_data.extend([
-                [language_manager.t("pdf.costs.wear_maintenance"), f"{project.wear_cost:.2f} €", f"{(project.wear_cost/project.total_cost*100):.1f}%"],
-                [language_manager.t("pdf.costs.total_costs"), f"{project.total_cost:.2f} €", '100.0%'],
-                [language_manager.t("pdf.costs.cost_per_model"), f"{(project.total_cost/project.model_count):.2f} €", for_x_pieces_text],
-            ])
+            # Calculation and amount columns
+            ('FONTSIZE', (1, 1), (1, -1), 8),
+            ('FONTSIZE', (2, 1), (2, -1), 9),
+            ('FONTNAME', (2, 1), (2, -1), 'Helvetica-Bold'),
+            ('ALIGN', (1, 1), (1, -1), 'LEFT'),
+            ('ALIGN', (2, 1), (2, -1), 'RIGHT'),
             
-            total_table = Table(total_data, colWidths=[6*cm, 5*cm, 6*cm])
-            total_table.setStyle(TableStyle([
-                # Header
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2E4057')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                
-                # Total costs row
-                ('BACKGROUND', (0, -2), (-1, -2), colors.HexColor('#4A6FA5')),
-                ('TEXTCOLOR', (0, -2), (-1, -2), colors.whitesmoke),
-                ('FONTNAME', (0, -2), (-1, -2), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, -2), (-1, -2), 11),
-                
-                # Per model row (gently highlighted)
-                ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#E8F4FD')),
-                ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, -1), (-1, -1), 10),
-                
-                # Separation line above total costs
-                ('LINEBELOW', (0, -3), (-1, -3), 2, colors.HexColor('#CCCCCC')),
-                
-                # Other rows
-                ('FONTSIZE', (0, 1), (-1, -4), 9),
-                ('ALIGN', (0, 1), (0, -1), 'LEFT'),
-                ('ALIGN', (1, 1), (1, -1), 'RIGHT'),
-                ('ALIGN', (2, 1), (2, -1), 'CENTER'),
-                ('GRID', (0, 0), (-1, -3), 1, colors.HexColor('#DDDDDD')),
-                ('GRID', (0, -2), (-1, -1), 1, colors.HexColor('#DDDDDD')),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ]))
-            story.append(total_table)
-            story.append(Spacer(1, 1*cm))
+            # General formatting
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#DDDDDD')),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+        ]),
+        'total_table': TableStyle([
+            # Header
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2E4057')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
             
-            # Footer
-            footer_text = language_manager.t("pdf.footer", date=datetime.now().strftime("%d.%m.%Y %H:%M"))
+            # Total costs row
+            ('BACKGROUND', (0, -2), (-1, -2), colors.HexColor('#4A6FA5')),
+            ('TEXTCOLOR', (0, -2), (-1, -2), colors.whitesmoke),
+            ('FONTNAME', (0, -2), (-1, -2), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, -2), (-1, -2), 11),
             
-            footer_style = ParagraphStyle(
-                'Footer',
-                parent=styles['Normal'],
-                fontSize=8,
-                alignment=TA_CENTER,
-                textColor=colors.HexColor('#666666'),
-                spaceAfter=0,
-                spaceBefore=0
-            )
-            story.append(Paragraph(footer_text, footer_style))
+            # Per model row (gently highlighted)
+            ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#E8F4FD')),
+            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, -1), (-1, -1), 10),
             
-            # Create PDF
-            doc.build(story)
-            return True
+            # Separation line above total costs
+            ('LINEBELOW', (0, -3), (-1, -3), 2, colors.HexColor('#CCCCCC')),
             
-        except Exception as e:
-            messagebox.showerror(language_manager.t("messages.error.title"), 
-                               language_manager.t("messages.success.pdf_creation_error", error=str(e)))
-            return False
+            # Other rows
+            ('FONTSIZE', (0, 1), (-1, -4), 9),
+            ('ALIGN', (0, 1), (0, -1), 'LEFT'),
+            ('ALIGN', (1, 1), (1, -1), 'RIGHT'),
+            ('ALIGN', (2, 1), (2, -1), 'CENTER'),
+            ('GRID', (0, 0), (-1, -3), 1, colors.HexColor('#DDDDDD')),
+            ('GRID', (0, -2), (-1, -1), 1, colors.HexColor('#DDDDDD')),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ]),
+    }
 
 
-class FilamentDialog:
-    """Dialog for adding new filaments"""
+class PDFExporter:
+    """Class for PDF export in professional quotation format"""
     
-    def __init__(self, parent, filament_manager: FilamentManager, language_manager):
-        self.parent = parent
-        self.filament_manager = filament_manager
-        self.language_manager = language_manager
-        self.result = None
-        
-        self.dialog = tk.Toplevel(parent)
-        self.dialog.title(self.language_manager.t("dialogs.filament.title"))
-        self.dialog.geometry("400x200")
-        self.dialog.resizable(False, False)
-        self.dialog.transient(parent)
-        self.dialog.grab_set()
+    @staticmethod
+    def show_error(error: Exception, language_manager):
+        """Reports a failed PDF export"""
+        t = language_manager.t
+        messagebox.showerror(t("messages.error.title"), 
+                           t("messages.success.pdf_creation_error", error=str(error)))
+    
+    @staticmethod
+    def pdf_content(project: PrintProject, language_manager) -> Dict[str, Any]:
+        """Resolves all texts and table rows of the quotation PDF (on the Tk thread, like every t() call)"""
+        t = language_manager.t
+        
+        # Determine correct translation for model count
+        models_text_key = "pdf.parameters.for_models_singular" if project.model_count == 1 else "pdf.parameters.for_models_plural"
+        models_text = t(models_text_key, count=project.model_count)
+        dryer_info = t("pdf.parameters.not_used") if not project.dryer_enabled else f"{t('pdf.parameters.power', power=project.dryer_power)}"
+        
+        project_data = [
+            [t("pdf.parameters.parameter"), t("pdf.parameters.value"), t("pdf.parameters.additional_info")],
+            [t("pdf.parameters.project_name"), project.project_name, ''],
+            [t("pdf.parameters.model"), project.model_name, ""],
+            [t("pdf.parameters.print_duration"), f"{project.print_duration:.1f}h {t('pdf.parameters.total_for')}", models_text],
+            [t("pdf.parameters.printer"), project.printer_name, t("pdf.parameters.power", power=project.printer_power)],
+            [t("pdf.parameters.material"), project.filament_name, t("pdf.parameters.amount", amount=project.filament_amount, price=project.filament_cost_per_kg)],
+            [t("pdf.parameters.dryer"), project.dryer_name if project.dryer_enabled else t("pdf.parameters.not_used"), dryer_info],
+            [t("pdf.parameters.electricity_rate"), f"{project.electricity_cost:.4f} €/kWh", ''],
+        ]
         
-        # Center dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (400 // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (200 // 2)
-        self.dialog.geometry(f"400x200+{x}+{y}")
+        # Euro amounts used by both cost tables, formatted in one pass
+        (filament_eur, printer_eur, dryer_eur, wear_eur, mechanical_eur, time_eur,
+         electronic_eur, total_eur, per_model_eur) = [f"{value:.2f} €" for value in (
+            project.filament_cost, project.electricity_cost_printer, project.electricity_cost_dryer,
+            project.wear_cost, project.mechanical_wear_cost, project.time_wear_cost,
+            project.electronic_wear_cost, project.total_cost,
+            project.total_cost / max(1, project.model_count))]
+        
+        cost_data = [
+            [t("pdf.costs.position"), t("pdf.costs.calculation"), t("pdf.costs.amount")],
+            [t("pdf.costs.material_costs"), 
+             f"{project.filament_amount:.0f}g × {project.filament_cost_per_kg:.2f}€/kg", 
+             filament_eur],
+            [t("pdf.costs.electricity_printer"), 
+             f"{project.printer_power:.0f}W × {project.print_duration:.1f}h × {project.electricity_cost:.4f}€/kWh", 
+             printer_eur],
+        ]
         
-        self.setup_dialog()
+        if project.dryer_enabled:
+            cost_data.append([t("pdf.costs.electricity_dryer"), 
+                            f"{project.dryer_power:.0f}W × {project.print_duration:.1f}h × {project.electricity_cost:.4f}€/kWh", 
+                            dryer_eur])
+        
+        # Detailed wear cost breakdown
+        cost_data.append([t("pdf.costs.wear_maintenance"), 
+                        t("pdf.costs.wear_breakdown"), 
+                        wear_eur])
+        
+        cost_data.append([f"  • {t('pdf.costs.mechanical_wear')}", 
+                        t("pdf.costs.mechanical_wear_calc"), 
+                        mechanical_eur])
+        
+        cost_data.append([f"  • {t('pdf.costs.time_wear')}", 
+                        t("pdf.costs.time_wear_calc"), 
+                        time_eur])
+        
+        cost_data.append([f"  • {t('pdf.costs.electronic_wear')}", 
+                        t("pdf.costs.electronic_wear_calc"), 
+                        electronic_eur])
+        
+        # One reciprocal for all percentages, a zero total yields 0.0% instead of raising
+        percent = 100.0 / project.total_cost if project.total_cost > 0 else 0.0
+        
+        total_data = [
+            [t("pdf.costs.position"), t("pdf.costs.amount"), t("pdf.costs.percentage_of_total")],
+            [t("pdf.costs.material_costs"), filament_eur, f"{project.filament_cost * percent:.1f}%"],
+            [t("pdf.costs.electricity_printer"), printer_eur, f"{project.electricity_cost_printer * percent:.1f}%"],
+        ]
         
-    # Wait for dialog to close
-        self.dialog.wait_window()
+        if project.dryer_enabled:
+            total_data.append([t("pdf.costs.electricity_dryer"), dryer_eur, f"{project.electricity_cost_dryer * percent:.1f}%"])
+        
+        # Determine unit text for pieces
+        for_x_pieces_text = t("units.for_x_pieces", count=project.model_count)
+        
+        total_data.extend([
+            [t("pdf.costs.wear_maintenance"), wear_eur, f"{project.wear_cost * percent:.1f}%"],
+            [t("pdf.costs.total_costs"), total_eur, '100.0%'],
+            [t("pdf.costs.cost_per_model"), per_model_eur, for_x_pieces_text],
+        ])
+        
+        # Footer
+        footer_text = t("pdf.footer", date=_FOOTER_DATE_FORMAT.format(datetime.now()))
+        
+        return {
+            'title': t("pdf.title"),
+            'project_info': t("pdf.project_info"),
+            'project_data': project_data,
+            'cost_breakdown': t("pdf.cost_breakdown"),
+            'cost_data': cost_data,
+            'cost_summary': t("pdf.cost_summary"),
+            'total_data': total_data,
+            'footer': footer_text,
+        }
     
-    def setup_dialog(self):
-        """Creates the dialog interface"""
-        main_frame = ttk.Frame(self.dialog, padding="20")
-        main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Title
-        ttk.Label(main_frame, text=self.language_manager.t("dialogs.filament.title"), 
-                 font=("Arial", 12, "bold")).grid(row=0, column=0, columnspan=2, pady=(0, 20))
+    @staticmethod
+    def build_pdf(content: Dict[str, Any], filepath: str):
+        """Writes the quotation PDF from pdf_content(), raises on failure (no Tk or translation calls, runs on a worker thread)"""
+        # reportlab is imported on first export only, it is slow to load
+        from reportlab.lib.pagesizes import A4
+        from reportlab.platypus import SimpleDocTemplate, Table, Paragraph, Spacer
+        from reportlab.lib.units import cm
         
-        # Filament Name
-        ttk.Label(main_frame, text=self.language_manager.t("dialogs.filament.name")).grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.name_var = tk.StringVar()
-        name_entry = ttk.Entry(main_frame, textvariable=self.name_var, width=30)
-        name_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=5, padx=(10, 0))
-        name_entry.focus()
+        doc = SimpleDocTemplate(filepath, pagesize=A4, topMargin=1*cm, bottomMargin=1*cm, 
+                              leftMargin=1*cm, rightMargin=1*cm)
+        styles = _pdf_styles()
         
-        # Cost per kg
-        ttk.Label(main_frame, text=self.language_manager.t("dialogs.filament.cost")).grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.cost_var = tk.StringVar()
-        ttk.Entry(main_frame, textvariable=self.cost_var, width=30).grid(row=2, column=1, sticky=(tk.W, tk.E), pady=5, padx=(10, 0))
+        # TITLE
+        story = [Paragraph(content['title'], styles['title'])]
         
-        # Buttons
-        button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=3, column=0, columnspan=2, pady=(20, 0))
+        # PROJECT INFORMATION
+        story.append(Paragraph(content['project_info'], styles['subtitle']))
         
-        ttk.Button(button_frame, text=self.language_manager.t("dialogs.filament.add_button"), 
-                  command=self.add_filament).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text=self.language_manager.t("dialogs.filament.cancel_button"), 
-                  command=self.cancel).pack(side=tk.LEFT, padx=5)
+        project_table = Table(content['project_data'], colWidths=[4.5*cm, 6*cm, 6.5*cm])
+        project_table.setStyle(styles['project_table'])
+        story.append(project_table)
+        story.append(Spacer(1, 0.3*cm))
         
-        main_frame.columnconfigure(1, weight=1)
+        # COST BREAKDOWN
+        story.append(Paragraph(content['cost_breakdown'], styles['subtitle']))
         
-        # Enter-Key Binding
-        self.dialog.bind('<Return>', lambda e: self.add_filament())
-        self.dialog.bind('<Escape>', lambda e: self.cancel())
-    
-    def add_filament(self):
-        """Adds the new filament"""
-        name = self.name_var.get().strip()
-        cost_str = self.cost_var.get().strip().replace(',', '.')
+        cost_table = Table(content['cost_data'], colWidths=[5*cm, 7*cm, 5*cm])
+        cost_table.setStyle(styles['cost_table'])
+        story.append(cost_table)
+        story.append(Spacer(1, 0.3*cm))
         
-        if not name:
-            messagebox.showerror(self.language_manager.t("messages.error.title"), self.language_manager.t("messages.error.name_required"))
-            return
+        # COST SUMMARY
+        story.append(Paragraph(content['cost_summary'], styles['subtitle']))
         
-        try:
-            cost = float(cost_str)
-            if cost <= 0:
-                raise ValueError(self.language_manager.t("messages.error.cost_required"))
-        except ValueError as ve:
-            messagebox.showerror(self.language_manager.t("messages.error.title"), str(ve))
-            return
+        total_table = Table(content['total_data'], colWidths=[6*cm, 5*cm, 6*cm])
+        total_table.setStyle(styles['total_table'])
+        story.append(total_table)
+        story.append(Spacer(1, 1*cm))
         
-        # Check if already exists
-        if not self.filament_manager.add_filament(name, cost):
-            messagebox.showerror(self.language_manager.t("messages.error.title"), self.language_manager.t("messages.error.filament_exists", name=name))
-            return
+        # Footer
+        story.append(Paragraph(content['footer'], styles['footer']))
         
-        # Successfully added
-        self.result = FilamentType(name, cost)
-        messagebox.showinfo(self.language_manager.t("messages.success.title"), self.language_manager.t("messages.success.filament_added", name=name))
-        self.dialog.destroy()
-    
-    def cancel(self):
-        """Cancels the dialog"""
-        self.dialog.destroy()
+        # Create PDF
+        doc.build(story)
 
 
-class PrinterDialog:
-    """Dialog for adding new printers"""
+# Cost display in the result section
+_COST_FORMAT = "{:.4f} €".format
+
+# Decimal comma -> point, and the accepted shape of an unsigned decimal number
+_COMMA_DOT = str.maketrans(",", ".")
+_NUMBER_RE = re.compile(r"\d+(?:\.\d*)?|\.\d+")
+# Anything that can still become such a number while typing ("", "1,", ".")
+_PARTIAL_NUMBER_RE = re.compile(r"\d*[.,]?\d*")
+_PARTIAL_INTEGER_RE = re.compile(r"[0-9]*")
+
+# Editable entries that only accept numbers, validated per keystroke by Tk (model_count is a whole number)
+_NUMERIC_FIELDS = ('model_count', 'print_duration', 'filament_amount', 'electricity_cost')
+_INTEGER_FIELDS = ('model_count',)
+
+
+def _parse_positive_number(text: str) -> Optional[float]:
+    """Parses an unsigned decimal (comma or point), returns None for malformed input without raising"""
+    text = text.strip().translate(_COMMA_DOT)
+    if not _NUMBER_RE.fullmatch(text):
+        return None
+    return float(text)
+
+
+def _is_partial_number(text: str) -> bool:
+    """Entry key validator: accepts the text if it is (or can still become) an unsigned decimal"""
+    return _PARTIAL_NUMBER_RE.fullmatch(text) is not None
+
+
+def _is_partial_integer(text: str) -> bool:
+    """Entry key validator: accepts the text if it consists of digits only (or is empty)"""
+    return _PARTIAL_INTEGER_RE.fullmatch(text) is not None
+
+
+def _format_number(value) -> str:
+    """Formats a number for an entry, floats in plain notation (str() gives e.g. "1e-05")"""
+    if isinstance(value, float):
+        return format(Decimal(repr(value)), 'f')
+    return str(value)
+
+
+def _configure_styles(root):
+    """Configures the button style themes once per Tk interpreter (ttk styles are global to it)"""
+    if getattr(root, "_styles_configured", False):
+        return
+    
+    style = ttk.Style(root)
+    style.configure('Calculate.TButton',
+                   font=('Arial', 12, 'bold'))
+    root._styles_configured = True
+
+
+def _center_geometry(window, width: int, height: int) -> str:
+    """Geometry string centering a window of the given size, the screen size is cached on the Tk root"""
+    root = window.nametowidget(".")
+    screen_size = getattr(root, "_screen_size", None)
+    if screen_size is None:
+        screen_size = root._screen_size = (root.winfo_screenwidth(), root.winfo_screenheight())
+    return f"{width}x{height}+{(screen_size[0] - width) // 2}+{(screen_size[1] - height) // 2}"
+
+
+# Opener for files on platforms without os.startfile
+_OPEN_COMMAND = "open" if sys.platform == "darwin" else "xdg-open"
+
+
+def _open_with_default_app(path: str):
+    """Opens a file in the platform's default application without waiting for it"""
+    if sys.platform == "win32":
+        os.startfile(path)
+    else:
+        subprocess.Popen([_OPEN_COMMAND, path])
+
+
+class _EntityDialog:
+    """Base dialog for adding a named catalog item with one numeric value (filament, printer, dryer)"""
+    
+    kind = ""  # Translation prefix: dialogs.<kind>.*, messages.*.<kind>_*
+    item_cls = None
+    value_label_key = ""
+    value_error_key = ""
+    
+    __slots__ = ("parent", "manager", "language_manager", "result", "dialog", "name_var", "value_var",
+                 "name_entry", "add_button", "cancel_button", "text_widgets", "closed")
     
-    def __init__(self, parent, printer_manager, language_manager):
+    # Widgets of the hidden Toplevel per dialog class, built on first open and reused afterwards
+    _shared = None
+    # The open dialog instance, the shared widgets' callbacks are bound once and dispatch to it
+    _active = None
+    
+    def __init__(self, parent, manager: _NamedCatalog, language_manager):
         self.parent = parent
-        self.printer_manager = printer_manager
+        self.manager = manager
         self.language_manager = language_manager
         self.result = None
         
-        self.dialog = tk.Toplevel(parent)
-        self.dialog.title(self.language_manager.t("dialogs.printer.title"))
-        self.dialog.geometry("400x200")
-        self.dialog.resizable(False, False)
-        self.dialog.transient(parent)
-        self.dialog.grab_set()
+        shared = type(self)._shared
+        if shared is None or not shared[0].winfo_exists():
+            shared = type(self)._shared = self.setup_dialog()
+        (self.dialog, self.name_var, self.value_var, self.name_entry,
+         self.add_button, self.cancel_button, self.text_widgets) = shared
+        self.closed = tk.BooleanVar(self.parent, False)
         
-        # Center dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (400 // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (200 // 2)
-        self.dialog.geometry(f"400x200+{x}+{y}")
+        # The reused widgets dispatch to this instance, reset the previous input
+        type(self)._active = self
+        self.update_texts()
+        self.name_var.set("")
+        self.value_var.set("")
         
-        self.setup_dialog()
+        self.dialog.deiconify()
+        self.dialog.grab_set()
+        self.name_entry.focus()
         
-        # Wait for dialog to close
-        self.dialog.wait_window()
+        # Wait for dialog to close (it is hidden, not destroyed, unless its parent goes away)
+        self.dialog.wait_variable(self.closed)
     
-    def setup_dialog(self):
-        """Creates the dialog interface"""
-        main_frame = ttk.Frame(self.dialog, padding="20")
+    def setup_dialog(self) -> tuple:
+        """Creates the dialog window and interface, returns the widgets kept for reuse"""
+        dialog = tk.Toplevel(self.parent)
+        dialog.geometry(_center_geometry(dialog, 400, 200))
+        dialog.resizable(False, False)
+        dialog.transient(self.parent)
+        
+        main_frame = ttk.Frame(dialog, padding="20")
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # Title
-        ttk.Label(main_frame, text=self.language_manager.t("dialogs.printer.title"), 
-                 font=("Arial", 12, "bold")).grid(row=0, column=0, columnspan=2, pady=(0, 20))
-        
-        # Printer name
-        ttk.Label(main_frame, text=self.language_manager.t("dialogs.printer.name")).grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.name_var = tk.StringVar()
-        name_entry = ttk.Entry(main_frame, textvariable=self.name_var, width=30)
+        title_label = ttk.Label(main_frame, font=("Arial", 12, "bold"))
+        title_label.grid(row=0, column=0, columnspan=2, pady=(0, 20))
+        
+        # Name
+        name_label = ttk.Label(main_frame)
+        name_label.grid(row=1, column=0, sticky=tk.W, pady=5)
+        name_var = tk.StringVar(dialog)
+        name_entry = ttk.Entry(main_frame, textvariable=name_var, width=30)
         name_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=5, padx=(10, 0))
-        name_entry.focus()
         
-        # Power consumption in watts
-        ttk.Label(main_frame, text=self.language_manager.t("dialogs.printer.power")).grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.power_var = tk.StringVar()
-        ttk.Entry(main_frame, textvariable=self.power_var, width=30).grid(row=2, column=1, sticky=(tk.W, tk.E), pady=5, padx=(10, 0))
+        # Value (cost per kg or power consumption in watts)
+        value_label = ttk.Label(main_frame)
+        value_label.grid(row=2, column=0, sticky=tk.W, pady=5)
+        value_var = tk.StringVar(dialog)
+        ttk.Entry(main_frame, textvariable=value_var, width=30).grid(row=2, column=1, sticky=(tk.W, tk.E), pady=5, padx=(10, 0))
         
         # Buttons
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=3, column=0, columnspan=2, pady=(20, 0))
         
-        ttk.Button(button_frame, text=self.language_manager.t("dialogs.printer.add_button"), 
-                  command=self.add_printer).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text=self.language_manager.t("dialogs.printer.cancel_button"), 
-                  command=self.cancel).pack(side=tk.LEFT, padx=5)
+        add_button = ttk.Button(button_frame)
+        add_button.pack(side=tk.LEFT, padx=5)
+        cancel_button = ttk.Button(button_frame)
+        cancel_button.pack(side=tk.LEFT, padx=5)
         
         main_frame.columnconfigure(1, weight=1)
         
-        # Enter-Key Binding
-        self.dialog.bind('<Return>', lambda e: self.add_printer())
-        self.dialog.bind('<Escape>', lambda e: self.cancel())
+        # Bound once for the lifetime of the Toplevel (rebinding per open would leak Tcl commands)
+        cls = type(self)
+        add_button.config(command=cls._dispatch_add)
+        cancel_button.config(command=cls._dispatch_cancel)
+        dialog.bind('<Return>', cls._dispatch_add)
+        dialog.bind('<Escape>', cls._dispatch_cancel)
+        dialog.protocol("WM_DELETE_WINDOW", cls._dispatch_cancel)
+        dialog.bind('<Destroy>', cls._dispatch_destroy)
+        
+        # Widget -> translation key, re-applied on every open so language changes show up
+        text_widgets = (
+            (title_label, f"dialogs.{self.kind}.title"),
+            (name_label, f"dialogs.{self.kind}.name"),
+            (value_label, self.value_label_key),
+            (add_button, f"dialogs.{self.kind}.add_button"),
+            (cancel_button, f"dialogs.{self.kind}.cancel_button"),
+        )
+        return dialog, name_var, value_var, name_entry, add_button, cancel_button, text_widgets
+    
+    @classmethod
+    def _dispatch_add(cls, event=None):
+        """Add button / Return handler of the shared widgets"""
+        if cls._active is not None:
+            cls._active.add_item()
     
-    def add_printer(self):
-        """Adds the new printer"""
+    @classmethod
+    def _dispatch_cancel(cls, event=None):
+        """Cancel button / Escape / window close handler of the shared widgets"""
+        if cls._active is not None:
+            cls._active.cancel()
+    
+    @classmethod
+    def _dispatch_destroy(cls, event):
+        """Destroy handler of the shared Toplevel"""
+        if cls._active is not None:
+            cls._active.on_destroy(event)
+        elif cls._shared is not None and event.widget is cls._shared[0]:
+            cls._shared = None
+    
+    def update_texts(self):
+        """Applies the current language to the dialog texts"""
+        texts = self.language_manager.bulk_t([key for _, key in self.text_widgets])
+        self.dialog.title(texts[0])  # The first entry is the title label
+        for (widget, _), text in zip(self.text_widgets, texts):
+            widget.config(text=text)
+    
+    def add_item(self, event=None):
+        """Validates the input and adds the new item to the manager"""
+        t = self.language_manager.t
         name = self.name_var.get().strip()
-        power_str = self.power_var.get().strip().replace(',', '.')
+        value = _parse_positive_number(self.value_var.get())
         
         if not name:
-            messagebox.showerror(self.language_manager.t("messages.error.title"), self.language_manager.t("messages.error.name_required"))
+            messagebox.showerror(t("messages.error.title"), t("messages.error.name_required"))
             return
         
-        try:
-            power = float(power_str)
-            if power <= 0:
-                raise ValueError(self.language_manager.t("messages.error.power_required"))
-        except ValueError as ve:
-            messagebox.showerror(self.language_manager.t("messages.error.title"), str(ve))
+        if value is None or value <= 0:
+            messagebox.showerror(t("messages.error.title"), t(self.value_error_key))
             return
         
         # Check if already exists
-        if not self.printer_manager.add_printer(name, power):
-            messagebox.showerror(self.language_manager.t("messages.error.title"), self.language_manager.t("messages.error.printer_exists", name=name))
+        item = self.item_cls(name, value)
+        if not self.manager.add_item(item):
+            messagebox.showerror(t("messages.error.title"), t(f"messages.error.{self.kind}_exists", name=name))
             return
         
         # Successfully added
-        self.result = PrinterType(name, power)
-        messagebox.showinfo(self.language_manager.t("messages.success.title"), self.language_manager.t("messages.success.printer_added", name=name))
-        self.dialog.destroy()
+        self.result = item
+        messagebox.showinfo(t("messages.success.title"), t(f"messages.success.{self.kind}_added", name=name))
+        self.close()
     
-    def cancel(self):
+    def cancel(self, event=None):
         """Cancels the dialog"""
-        self.dialog.destroy()
+        self.close()
+    
+    def close(self):
+        """Hides the dialog for reuse and ends the wait in __init__"""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+        type(self)._active = None
+        self.closed.set(True)
+    
+    def on_destroy(self, event):
+        """Ends the wait in __init__ if the dialog is destroyed, the next open builds a new one"""
+        # The Toplevel's bindings also fire for its child widgets
+        if event.widget is self.dialog:
+            type(self)._shared = None
+            type(self)._active = None
+            self.closed.set(True)
 
 
-class DryerDialog:
-    """Dialog for adding new dryers"""
+class FilamentDialog(_EntityDialog):
+    """Dialog for adding new filaments"""
     
-    def __init__(self, parent, dryer_manager, language_manager):
-        self.parent = parent
-        self.dryer_manager = dryer_manager
-        self.language_manager = language_manager
-        self.result = None
-        
-        self.dialog = tk.Toplevel(parent)
-        self.dialog.title(self.language_manager.t("dialogs.dryer.title"))
-        self.dialog.geometry("400x200")
-        self.dialog.resizable(False, False)
-        self.dialog.transient(parent)
-        self.dialog.grab_set()
-        
-        # Center dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (400 // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (200 // 2)
-        self.dialog.geometry(f"400x200+{x}+{y}")
-        
-        self.setup_dialog()
-        
-        # Wait for dialog to close
-        self.dialog.wait_window()
+    __slots__ = ()
     
-    def setup_dialog(self):
-        """Creates the dialog interface"""
-        main_frame = ttk.Frame(self.dialog, padding="20")
-        main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Title
-        ttk.Label(main_frame, text=self.language_manager.t("dialogs.dryer.title"), 
-                 font=("Arial", 12, "bold")).grid(row=0, column=0, columnspan=2, pady=(0, 20))
-        
-        # Dryer Name
-        ttk.Label(main_frame, text=self.language_manager.t("dialogs.dryer.name")).grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.name_var = tk.StringVar()
-        name_entry = ttk.Entry(main_frame, textvariable=self.name_var, width=30)
-        name_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=5, padx=(10, 0))
-        name_entry.focus()
-        
-        # Power consumption in watts
-        ttk.Label(main_frame, text=self.language_manager.t("dialogs.dryer.power")).grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.power_var = tk.StringVar()
-        ttk.Entry(main_frame, textvariable=self.power_var, width=30).grid(row=2, column=1, sticky=(tk.W, tk.E), pady=5, padx=(10, 0))
-        
-        # Buttons
-        button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=3, column=0, columnspan=2, pady=(20, 0))
-        
-        ttk.Button(button_frame, text=self.language_manager.t("dialogs.dryer.add_button"), 
-                  command=self.add_dryer).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text=self.language_manager.t("dialogs.dryer.cancel_button"), 
-                  command=self.cancel).pack(side=tk.LEFT, padx=5)
-        
-        main_frame.columnconfigure(1, weight=1)
-        
-        # Enter-Key Binding
-        self.dialog.bind('<Return>', lambda e: self.add_dryer())
-        self.dialog.bind('<Escape>', lambda e: self.cancel())
+    kind = "filament"
+    item_cls = FilamentType
+    value_label_key = "dialogs.filament.cost"
+    value_error_key = "messages.error.cost_required"
+
+
+class PrinterDialog(_EntityDialog):
+    """Dialog for adding new printers"""
     
-    def add_dryer(self):
-        """Adds the new dryer"""
-        name = self.name_var.get().strip()
-        power_str = self.power_var.get().strip().replace(',', '.')
-        
-        if not name:
-            messagebox.showerror(self.language_manager.t("messages.error.title"), self.language_manager.t("messages.error.name_required"))
-            return
-        
-        try:
-            power = float(power_str)
-            if power <= 0:
-                raise ValueError(self.language_manager.t("messages.error.power_required"))
-        except ValueError as ve:
-            messagebox.showerror(self.language_manager.t("messages.error.title"), str(ve))
-            return
-        
-        # Check if already exists
-        if not self.dryer_manager.add_dryer(name, power):
-            messagebox.showerror(self.language_manager.t("messages.error.title"), self.language_manager.t("messages.error.dryer_exists", name=name))
-            return
-        
-        # Successfully added
-        self.result = DryerType(name, power)
-        messagebox.showinfo(self.language_manager.t("messages.success.title"), self.language_manager.t("messages.success.dryer_added", name=name))
-        self.dialog.destroy()
+    __slots__ = ()
     
-    def cancel(self):
-        """Cancels the dialog"""
-        self.dialog.destroy()
+    kind = "printer"
+    item_cls = PrinterType
+    value_label_key = "dialogs.printer.power"
+    value_error_key = "messages.error.power_required"
+
+
+class DryerDialog(_EntityDialog):
+    """Dialog for adding new dryers"""
+    
+    __slots__ = ()
+    
+    kind = "dryer"
+    item_cls = DryerType
+    value_label_key = "dialogs.dryer.power"
+    value_error_key = "messages.error.power_required"
 
 
 class AboutDialog:
     """About dialog with app information, homepage link and donation button"""
     
+    __slots__ = ("parent", "language_manager", "dialog", "app_title")
+    
+    # Resized app icon, shared by all dialog instances (the source file never changes)
+    _icon_photo = None
+    
     def __init__(self, parent, language_manager):
         self.parent = parent
         self.language_manager = language_manager
         
         self.dialog = tk.Toplevel(parent)
         self.dialog.title(self.language_manager.t("dialogs.about.title"))
-        self.dialog.geometry("490x350")
+        self.dialog.geometry(_center_geometry(self.dialog, 490, 350))
         self.dialog.resizable(False, False)
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
-        # Center dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (490 // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (350 // 2)
-        self.dialog.geometry(f"490x350+{x}+{y}")
-        
         self.setup_dialog()
         
         # Wait for dialog to close
@@ -987,46 +1089,25 @@ class AboutDialog:
         main_frame = ttk.Frame(self.dialog, padding="20")
         main_frame.pack(fill=tk.BOTH, expand=True)
         
-        # App icon
-        try:
-            # Try to load app icon
-            if hasattr(sys, '_MEIPASS'):
-                # Running as PyInstaller bundle
-                icon_path = os.path.join(sys._MEIPASS, "assets", "icon.png")
-            else:
-                # Running as script
-                icon_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "icon.png")
-            
-            if PIL_AVAILABLE and os.path.exists(icon_path):
-                # Load and resize the image
-                image = Image.open(icon_path)
-                image = image.resize((64, 64), Image.Resampling.LANCZOS)
-                self.icon_photo = ImageTk.PhotoImage(image)
-                
-                icon_label = ttk.Label(main_frame, image=self.icon_photo)
-                icon_label.grid(row=0, column=0, columnspan=2, pady=(0, 10))
-                
-                # App title
-                app_title = ttk.Label(main_frame, text="3D-Print CostCulator", 
-                                     font=("Arial", 16, "bold"))
-                app_title.grid(row=1, column=0, columnspan=2, pady=(0, 5))
-            else:
-                # Fallback without icon
-                app_title = ttk.Label(main_frame, text="3D-Print CostCulator", 
-                                     font=("Arial", 16, "bold"))
-                app_title.grid(row=0, column=0, columnspan=2, pady=(0, 10))
-        except Exception:
-            # Any error, use simple title
-            app_title = ttk.Label(main_frame, text="3D-Print CostCulator", 
-                                 font=("Arial", 16, "bold"))
-            app_title.grid(row=0, column=0, columnspan=2, pady=(0, 10))
+        # App title, the icon is placed above it (row 0) when available
+        self.app_title = ttk.Label(main_frame, text="3D-Print CostCulator", 
+                                  font=("Arial", 16, "bold"))
+        self.app_title.grid(row=1, column=0, columnspan=2, pady=(0, 10))
+        
+        if AboutDialog._icon_photo is not None:
+            self.show_icon(main_frame)
+        else:
+            # Decoding and resizing is slow, do it after the dialog has been drawn
+            self.dialog.after_idle(self.load_icon, main_frame)
         
         version_label = ttk.Label(main_frame, text="Version 1.0", 
                                  font=("Arial", 10))
         version_label.grid(row=2, column=0, columnspan=2, pady=(0, 20))
         
         # App description
-        description_text = self.language_manager.t("dialogs.about.description")
+        description_text, homepage_text, donate_text, source_text, close_text = self.language_manager.bulk_t((
+            "dialogs.about.description", "dialogs.about.homepage", "dialogs.about.donate",
+            "dialogs.about.source", "dialogs.about.close"))
         description_label = ttk.Label(main_frame, text=description_text, 
                                      wraplength=400, justify=tk.CENTER)
         description_label.grid(row=3, column=0, columnspan=2, pady=(0, 20))
@@ -1042,47 +1123,65 @@ class AboutDialog:
         
         # Homepage button
         homepage_button = ttk.Button(button_frame, 
-                                    text=self.language_manager.t("dialogs.about.homepage"), 
+                                    text=homepage_text, 
                                     command=self.open_homepage)
         homepage_button.pack(side=tk.LEFT, padx=5)
         
         # Donation button
         donation_button = ttk.Button(button_frame, 
-                                    text=self.language_manager.t("dialogs.about.donate"), 
+                                    text=donate_text, 
                                     command=self.open_donation)
         donation_button.pack(side=tk.LEFT, padx=5)
         
         # Source button
         source_button = ttk.Button(button_frame, 
-                                    text=self.language_manager.t("dialogs.about.source"), 
+                                    text=source_text, 
                                     command=self.open_source)
         source_button.pack(side=tk.LEFT, padx=5)
         
         # Close button
         close_button = ttk.Button(button_frame, 
-                                 text=self.language_manager.t("dialogs.about.close"), 
+                                 text=close_text, 
                                  command=self.close_dialog)
         close_button.pack(side=tk.LEFT, padx=5)
         
         # ESC key binding
-        self.dialog.bind('<Escape>', lambda e: self.close_dialog())
+        self.dialog.bind('<Escape>', self.close_dialog)
+    
+    def load_icon(self, main_frame):
+        """Loads and resizes the app icon once, later dialogs reuse it"""
+        try:
+            icon_path = os.path.join(ASSET_DIR, "icon.png")
+            if not (PIL_AVAILABLE and os.path.exists(icon_path)) or not self.dialog.winfo_exists():
+                return
+            
+            Image, ImageTk = _load_pil()
+            image = Image.open(icon_path)
+            image = image.resize((64, 64), Image.Resampling.LANCZOS)
+            AboutDialog._icon_photo = ImageTk.PhotoImage(image)
+            self.show_icon(main_frame)
+        except Exception:
+            pass  # Any error, keep the simple title
+    
+    def show_icon(self, main_frame):
+        """Places the cached app icon above the title"""
+        icon_label = ttk.Label(main_frame, image=AboutDialog._icon_photo)
+        icon_label.grid(row=0, column=0, columnspan=2, pady=(0, 10))
+        self.app_title.grid_configure(pady=(0, 5))
     
     def open_homepage(self):
         """Opens the homepage in the default browser"""
-        import webbrowser
         webbrowser.open("https://xscr33mlabs.com")
     
     def open_donation(self):
         """Opens the donation page in the default browser"""
-        import webbrowser
         webbrowser.open("https://ko-fi.com/xscr33m")
     
     def open_source(self):
         """Opens the GitHub repository in the default browser"""
-        import webbrowser
         webbrowser.open("https://github.com/xscr33m/3D-Print_CostCulator")
     
-    def close_dialog(self):
+    def close_dialog(self, event=None):
         """Closes the dialog"""
         self.dialog.destroy()
 
@@ -1090,6 +1189,10 @@ class AboutDialog:
 class PrintCalculatorGUI:
     """Main class for the GUI application"""
     
+    # Pause after the last keystroke before input changes are processed
+    INPUT_DEBOUNCE_MS = 150
+    PDF_POLL_MS = 50  # Interval for checking on a running PDF export
+    
     def __init__(self):
         self.root = tk.Tk()
 
@@ -1103,13 +1206,13 @@ class PrintCalculatorGUI:
         # Center window
         self.center_window()
         
-        # Language Manager integration
-        self.language_manager = language_manager
+        # Language Manager integration (the real instance, skips the module proxy on every t() call)
+        self.language_manager = get_language_manager()
         self.language_manager.load_language_preference()
         self.language_manager.register_update_callback(self.update_gui_texts)
         
         # Configure button style
-        self.setup_styles()
+        _configure_styles(self.root)
         
         # Initialize managers
         self.filament_manager = FilamentManager()
@@ -1119,39 +1222,35 @@ class PrintCalculatorGUI:
         # Current project
         self.current_project = PrintProject()
         self.current_file_path = None
+        self._state_buttons = ()  # Filled by setup_ui
+        self._input_after_id = None  # Pending debounced input change
+        self._gui_built = False  # Set once the result section exists
+        self._combo_values = {}  # Combobox -> name tuple last sent to Tk
+        self._widget_states = {}  # Button -> state last set through _set_state
+        self._cost_label_state = {}  # Result label name -> (text, color) last sent to Tk
+        self._window_title = None  # Window title last sent to Tk
+        self._results_version = 0  # Bumped whenever the project's cost results may have changed
+        self._rendered_version = -1  # Results version last shown in the result section
+        self._highlight_after_id = None  # Pending end of the total cost success highlight
+        self._pdf_future = None  # Running PDF export
         
         self.setup_ui()
         
         # Set initial language texts and update display after GUI is fully created
-        self.root.after(100, lambda: [self.update_gui_texts(), self.update_display()])
+        self.root.after(100, self.initial_refresh)
+    
+    def initial_refresh(self):
+        """Sets the language texts and result display once the GUI is fully created"""
+        self.update_gui_texts()
+        self.update_display()
     
-    def setup_styles(self):
-        """Configures the style themes for the buttons"""
-        style = ttk.Style()
-        
-        style.configure('Calculate.TButton',
-                       font=('Arial', 12, 'bold'))
-        
     def set_window_icon(self):
         """Sets the window icon"""
         try:
-            # Get the directory where the script is located
-            if hasattr(sys, '_MEIPASS'):
-                # Running as PyInstaller bundle
-                base_path = sys._MEIPASS
-            else:
-                # Running as script
-                base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            
-            icon_path = os.path.join(base_path, "assets", "icon.ico")
+            icon_path = os.path.join(ASSET_DIR, "icon.ico")
             
             if os.path.exists(icon_path):
                 self.root.iconbitmap(icon_path)
-            else:
-                # Try alternative path for development
-                dev_icon_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "icon.ico")
-                if os.path.exists(dev_icon_path):
-                    self.root.iconbitmap(dev_icon_path)
         except Exception as e:
             # Silently continue if icon can't be loaded
             print(f"Could not load icon: {e}")
@@ -1161,9 +1260,7 @@ class PrintCalculatorGUI:
         self.root.update_idletasks()
         width = self.root.winfo_width()
         height = self.root.winfo_height()
-        pos_x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        pos_y = (self.root.winfo_screenheight() // 2) - (height // 2)
-        self.root.geometry(f"{width}x{height}+{pos_x}+{pos_y}")
+        self.root.geometry(_center_geometry(self.root, width, height))
     
     def toggle_language(self):
         """Switches between German and English"""
@@ -1172,6 +1269,11 @@ class PrintCalculatorGUI:
         self.language_manager.set_language(new_language)
         self.language_manager.save_language_preference()
     
+    def set_status(self, key: str, **kwargs):
+        """Shows a status message by translation key, the key is kept for language changes"""
+        self._status = (key, kwargs)
+        self.status_var.set(self.language_manager.t(key, **kwargs))
+    
     def update_language_button(self):
         """Updates the language button text"""
         current = self.language_manager.get_current_language()
@@ -1180,6 +1282,58 @@ class PrintCalculatorGUI:
         else:
             self.language_button.config(text=" EN ")
     
+    # Widget attribute -> translation key, applied by update_gui_texts
+    _TEXT_BINDINGS = (
+        # Buttons
+        ("new_project_button", "gui.buttons.new_project"),
+        ("load_project_button", "gui.menu.load_project"),
+        ("save_project_button", "gui.menu.save_project"),
+        ("save_as_button", "gui.menu.save_as"),
+        ("export_pdf_button", "gui.menu.export_pdf"),
+        ("calculate_button", "gui.buttons.calculate"),
+        
+        # Project frame and labels
+        ("project_frame", "gui.project.title"),
+        ("project_name_label", "gui.project.name"),
+        ("model_name_label", "gui.project.model"),
+        ("model_count_label", "gui.project.model_count"),
+        ("print_duration_label", "gui.project.print_duration"),
+        
+        # Material frame and labels
+        ("filament_frame", "gui.materials.title"),
+        ("filament_label", "gui.materials.filament"),
+        ("filament_cost_label", "gui.materials.cost_per_kg"),
+        ("filament_amount_label", "gui.materials.amount"),
+        
+        # Printer frame and labels
+        ("printer_frame", "gui.printer.title"),
+        ("printer_label", "gui.printer.printer"),
+        ("printer_power_label", "gui.printer.power"),
+        
+        # Dryer frame and labels
+        ("dryer_frame", "gui.dryer.title"),
+        ("dryer_checkbox", "gui.dryer.enable"),
+        ("dryer_label", "gui.dryer.dryer"),
+        ("dryer_power_label", "gui.dryer.power"),
+        
+        # Cost frame and labels
+        ("costs_frame", "gui.electricity.title"),
+        ("electricity_rate_label", "gui.electricity.rate"),
+        ("wear_cost_label", "gui.electricity.wear_cost"),
+        
+        # Results
+        ("result_frame", "gui.results.title"),
+        ("results_placeholder", "gui.status.please_calculate"),
+        ("individual_costs_label", "gui.results.individual_costs"),
+        ("total_costs_label", "gui.results.total_costs"),
+        ("total_label", "gui.results.total"),
+        ("per_model_label", "gui.results.cost_per_model"),
+        ("filament_cost_title", "gui.results.material_cost"),
+        ("electricity_printer_title", "gui.results.electricity_printer"),
+        ("electricity_dryer_title", "gui.results.electricity_dryer"),
+        ("wear_cost_title", "gui.results.wear_cost"),
+    )
+    
     def update_gui_texts(self):
         """Updates all GUI texts after language change"""
         try:
@@ -1191,102 +1345,23 @@ class PrintCalculatorGUI:
                 title = base_title
             if self.current_file_path:
                 title += f" [{self.current_file_path}]"
-            self.root.title(title)
+            self._set_window_title(title)
             
             # Update language button
             if hasattr(self, 'language_button'):
                 self.update_language_button()
             
-            # Update buttons
-            if hasattr(self, 'new_project_button'):
-                self.new_project_button.config(text=self.language_manager.t("gui.buttons.new_project"))
-            if hasattr(self, 'load_project_button'):
-                self.load_project_button.config(text=self.language_manager.t("gui.menu.load_project"))
-            if hasattr(self, 'save_project_button'):
-                self.save_project_button.config(text=self.language_manager.t("gui.menu.save_project"))
-            if hasattr(self, 'save_as_button'):
-                self.save_as_button.config(text=self.language_manager.t("gui.menu.save_as"))
-            if hasattr(self, 'export_pdf_button'):
-                self.export_pdf_button.config(text=self.language_manager.t("gui.menu.export_pdf"))
-            if hasattr(self, 'calculate_button'):
-                self.calculate_button.config(text=self.language_manager.t("gui.buttons.calculate"))
+            # Static widget texts, translated in one pass
+            texts = self.language_manager.bulk_t([key for _, key in self._TEXT_BINDINGS])
+            for (attr, _), text in zip(self._TEXT_BINDINGS, texts):
+                widget = getattr(self, attr, None)
+                if widget is not None:
+                    widget.config(text=text)
             
-            # Project frame and labels
-            if hasattr(self, 'project_frame'):
-                self.project_frame.config(text=self.language_manager.t("gui.project.title"))
-            if hasattr(self, 'project_name_label'):
-                self.project_name_label.config(text=self.language_manager.t("gui.project.name"))
-            if hasattr(self, 'model_name_label'):
-                self.model_name_label.config(text=self.language_manager.t("gui.project.model"))
-            if hasattr(self, 'model_count_label'):
-                self.model_count_label.config(text=self.language_manager.t("gui.project.model_count"))
-            if hasattr(self, 'print_duration_label'):
-                self.print_duration_label.config(text=self.language_manager.t("gui.project.print_duration"))
-            
-            # Material frame and labels
-            if hasattr(self, 'filament_frame'):
-                self.filament_frame.config(text=self.language_manager.t("gui.materials.title"))
-            if hasattr(self, 'filament_label'):
-                self.filament_label.config(text=self.language_manager.t("gui.materials.filament"))
-            if hasattr(self, 'filament_cost_label'):
-                self.filament_cost_label.config(text=self.language_manager.t("gui.materials.cost_per_kg"))
-            if hasattr(self, 'filament_amount_label'):
-                self.filament_amount_label.config(text=self.language_manager.t("gui.materials.amount"))
-            
-            # Printer frame and labels
-            if hasattr(self, 'printer_frame'):
-                self.printer_frame.config(text=self.language_manager.t("gui.printer.title"))
-            if hasattr(self, 'printer_label'):
-                self.printer_label.config(text=self.language_manager.t("gui.printer.printer"))
-            if hasattr(self, 'printer_power_label'):
-                self.printer_power_label.config(text=self.language_manager.t("gui.printer.power"))
-            
-            # Dryer frame and labels
-            if hasattr(self, 'dryer_frame'):
-                self.dryer_frame.config(text=self.language_manager.t("gui.dryer.title"))
-            if hasattr(self, 'dryer_checkbox'):
-                self.dryer_checkbox.config(text=self.language_manager.t("gui.dryer.enable"))
-            if hasattr(self, 'dryer_label'):
-                self.dryer_label.config(text=self.language_manager.t("gui.dryer.dryer"))
-            if hasattr(self, 'dryer_power_label'):
-                self.dryer_power_label.config(text=self.language_manager.t("gui.dryer.power"))
-            
-            # Cost frame and labels
-            if hasattr(self, 'costs_frame'):
-                self.costs_frame.config(text=self.language_manager.t("gui.electricity.title"))
-            if hasattr(self, 'electricity_rate_label'):
-                self.electricity_rate_label.config(text=self.language_manager.t("gui.electricity.rate"))
-            if hasattr(self, 'wear_cost_label'):
-                self.wear_cost_label.config(text=self.language_manager.t("gui.electricity.wear_cost"))
-            
-            # Update results
-            if hasattr(self, 'result_frame'):
-                self.result_frame.config(text=self.language_manager.t("gui.results.title"))
-            if hasattr(self, 'individual_costs_label'):
-                self.individual_costs_label.config(text=self.language_manager.t("gui.results.individual_costs"))
-            if hasattr(self, 'total_costs_label'):
-                self.total_costs_label.config(text=self.language_manager.t("gui.results.total_costs"))
-            if hasattr(self, 'total_label'):
-                self.total_label.config(text=self.language_manager.t("gui.results.total"))
-            if hasattr(self, 'per_model_label'):
-                self.per_model_label.config(text=self.language_manager.t("gui.results.cost_per_model"))
-            if hasattr(self, 'filament_cost_title'):
-                self.filament_cost_title.config(text=self.language_manager.t("gui.results.material_cost"))
-            if hasattr(self, 'electricity_printer_title'):
-                self.electricity_printer_title.config(text=self.language_manager.t("gui.results.electricity_printer"))
-            if hasattr(self, 'electricity_dryer_title'):
-                self.electricity_dryer_title.config(text=self.language_manager.t("gui.results.electricity_dryer"))
-            if hasattr(self, 'wear_cost_title'):
-                self.wear_cost_title.config(text=self.language_manager.t("gui.results.wear_cost"))
-            
-            # Update status
+            # Update status, re-rendered from its key so dynamic messages are translated too
             if hasattr(self, 'status_var'):
-                current_status = self.status_var.get()
-                if "Bereit" in current_status or "Ready" in current_status:
-                    self.status_var.set(self.language_manager.t("status.ready"))
-                elif "Berechnung abgeschlossen" in current_status or "Calculation complete" in current_status:
-                    # Status messages with dynamic content remain as they are
-                    pass
+                status_key, status_args = self._status
+                self.set_status(status_key, **status_args)
                     
         except Exception as e:
             print(f"Error updating GUI texts: {e}")
@@ -1300,19 +1375,22 @@ class PrintCalculatorGUI:
         # Enable/disable buttons based on project status
         state = "normal" if has_project else "disabled"
         
-        if hasattr(self, 'save_project_button'):
+        for button in self._state_buttons:
+            # Export stays disabled while a PDF export is running
+            if button is self.export_pdf_button and self._pdf_future is not None:
+                self._set_state(button, "disabled")
+            else:
+                self._set_state(button, state)
+        
+        if self._state_buttons:
             # Save button is only enabled if we have a current file path
             save_state = "normal" if self.current_file_path else "disabled"
-            self.save_project_button.config(state=save_state)
-        
-        if hasattr(self, 'save_as_button'):
-            self.save_as_button.config(state=state)
-        
-        if hasattr(self, 'export_pdf_button'):
-            self.export_pdf_button.config(state=state)
+            self._set_state(self.save_project_button, save_state)
     
     def setup_ui(self):
         """Creates the user interface"""
+        t = self.language_manager.t
+        
         # Main frame
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -1336,32 +1414,35 @@ class PrintCalculatorGUI:
         self.language_button.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=2)
         
         # Project action buttons (distributed across the row)
-        self.new_project_button = ttk.Button(menu_frame, text=self.language_manager.t("gui.buttons.new_project"), 
+        self.new_project_button = ttk.Button(menu_frame, text=t("gui.buttons.new_project"), 
                                            command=self.new_project)
         self.new_project_button.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=2)
         
-        self.load_project_button = ttk.Button(menu_frame, text=self.language_manager.t("gui.menu.load_project"), 
+        self.load_project_button = ttk.Button(menu_frame, text=t("gui.menu.load_project"), 
                                             command=self.load_project)
         self.load_project_button.grid(row=0, column=2, sticky=(tk.W, tk.E), padx=2)
         
-        self.save_project_button = ttk.Button(menu_frame, text=self.language_manager.t("gui.menu.save_project"), 
+        self.save_project_button = ttk.Button(menu_frame, text=t("gui.menu.save_project"), 
                                             command=self.save_project, state="disabled")
         self.save_project_button.grid(row=0, column=3, sticky=(tk.W, tk.E), padx=2)
         
-        self.save_as_button = ttk.Button(menu_frame, text=self.language_manager.t("gui.menu.save_as"), 
+        self.save_as_button = ttk.Button(menu_frame, text=t("gui.menu.save_as"), 
                                        command=self.save_project_as, state="disabled")
         self.save_as_button.grid(row=0, column=4, sticky=(tk.W, tk.E), padx=2)
         
-        self.export_pdf_button = ttk.Button(menu_frame, text=self.language_manager.t("gui.menu.export_pdf"), 
+        self.export_pdf_button = ttk.Button(menu_frame, text=t("gui.menu.export_pdf"), 
                                           command=self.export_pdf, state="disabled")
         self.export_pdf_button.grid(row=0, column=5, sticky=(tk.W, tk.E), padx=2)
         
+        # Buttons enabled as soon as there is any project data (see update_button_states)
+        self._state_buttons = (self.save_as_button, self.export_pdf_button)
+        
         # Keyboard shortcuts
-        self.root.bind('<Control-n>', lambda e: self.new_project())
-        self.root.bind('<Control-o>', lambda e: self.load_project())
-        self.root.bind('<Control-s>', lambda e: self.save_project())
-        self.root.bind('<Control-S>', lambda e: self.save_project_as())  # Shift+S
-        self.root.bind('<Control-e>', lambda e: self.export_pdf())
+        self.root.bind('<Control-n>', self.new_project)
+        self.root.bind('<Control-o>', self.load_project)
+        self.root.bind('<Control-s>', self.save_project)
+        self.root.bind('<Control-S>', self.save_project_as)  # Shift+S
+        self.root.bind('<Control-e>', self.export_pdf)
         
         # Input data displayed directly in main frame
         main_frame.rowconfigure(1, weight=1)
@@ -1373,7 +1454,7 @@ class PrintCalculatorGUI:
         status_frame.columnconfigure(0, weight=1)
         
         self.status_var = tk.StringVar()
-        self.status_var.set(self.language_manager.t("status.ready"))
+        self.set_status("status.ready")
         status_bar = ttk.Label(status_frame, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
         status_bar.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, 5))
         
@@ -1383,6 +1464,8 @@ class PrintCalculatorGUI:
     
     def setup_input_tab(self, parent):
         """Creates the input tab"""
+        t = self.language_manager.t
+        
         # Uniform grid configuration for perfect alignment
         parent.columnconfigure(0, weight=1, uniform="col")
         parent.columnconfigure(1, weight=1, uniform="col")
@@ -1392,11 +1475,12 @@ class PrintCalculatorGUI:
         parent.rowconfigure(3, weight=1)  # Row 3 (Kosten/Extras)
         
         # Project information
-        self.project_frame = ttk.LabelFrame(parent, text=self.language_manager.t("gui.project.title"), padding="10")
+        self.project_frame = ttk.LabelFrame(parent, text=t("gui.project.title"), padding="10")
         self.project_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5, padx=5)
         
-        # StringVars for input fields
+        # StringVars for combobox-backed and automatically filled fields, free-text entries are read directly
         self.vars = {}
+        self.entries = {}
         
         # Split project frame into two columns with different weights
         # Left column (Project Name, Model Name) gets more space
@@ -1408,16 +1492,10 @@ class PrintCalculatorGUI:
         left_project_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 10))
         
         # Project name (left)
-        self.project_name_label = ttk.Label(left_project_frame, text=self.language_manager.t("gui.project.name"))
-        self.project_name_label.grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.vars['project_name'] = tk.StringVar()
-        ttk.Entry(left_project_frame, textvariable=self.vars['project_name'], width=45).grid(row=0, column=1, sticky=(tk.W, tk.E), pady=2, padx=(10, 0))
+        self.project_name_label, _ = self._entry_row(left_project_frame, 0, "gui.project.name", 'project_name', width=45)
         
         # 3D model (left)
-        self.model_name_label = ttk.Label(left_project_frame, text=self.language_manager.t("gui.project.model"))
-        self.model_name_label.grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.vars['model_name'] = tk.StringVar()
-        ttk.Entry(left_project_frame, textvariable=self.vars['model_name'], width=45).grid(row=1, column=1, sticky=(tk.W, tk.E), pady=2, padx=(10, 0))
+        self.model_name_label, _ = self._entry_row(left_project_frame, 1, "gui.project.model", 'model_name', width=45)
         
         left_project_frame.columnconfigure(1, weight=1)
         
@@ -1426,28 +1504,24 @@ class PrintCalculatorGUI:
         right_project_frame.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(10, 0))
         
         # Model count (right)
-        self.model_count_label = ttk.Label(right_project_frame, text=self.language_manager.t("gui.project.model_count"))
-        self.model_count_label.grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.vars['model_count'] = tk.StringVar(value="1")
-        ttk.Entry(right_project_frame, textvariable=self.vars['model_count'], width=13).grid(row=0, column=1, sticky=(tk.W, tk.E), pady=2, padx=(10, 0))
+        self.model_count_label, _ = self._entry_row(right_project_frame, 0, "gui.project.model_count", 'model_count',
+                                                    width=13, value="1")
         
         # Print duration (right)
-        self.print_duration_label = ttk.Label(right_project_frame, text=self.language_manager.t("gui.project.print_duration"))
-        self.print_duration_label.grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.vars['print_duration'] = tk.StringVar()
-        ttk.Entry(right_project_frame, textvariable=self.vars['print_duration'], width=13).grid(row=1, column=1, sticky=(tk.W, tk.E), pady=2, padx=(10, 0))
+        self.print_duration_label, _ = self._entry_row(right_project_frame, 1, "gui.project.print_duration", 'print_duration',
+                                                       width=13)
         
         right_project_frame.columnconfigure(1, weight=1)
         
         # Filament information
-        self.filament_frame = ttk.LabelFrame(parent, text=self.language_manager.t("gui.materials.title"), padding="10")
+        self.filament_frame = ttk.LabelFrame(parent, text=t("gui.materials.title"), padding="10")
         self.filament_frame.grid(row=2, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5, padx=5)
         
         # Filament dropdown with add button
         filament_select_frame = ttk.Frame(self.filament_frame)
         filament_select_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=2)
         
-        self.filament_label = ttk.Label(filament_select_frame, text=self.language_manager.t("gui.materials.filament"))
+        self.filament_label = ttk.Label(filament_select_frame, text=t("gui.materials.filament"))
         self.filament_label.grid(row=0, column=0, sticky=tk.W, pady=2)
         
         self.vars['filament_name'] = tk.StringVar()
@@ -1470,17 +1544,11 @@ class PrintCalculatorGUI:
         filament_select_frame.columnconfigure(1, weight=1)
         
         # Filament details (automatically filled)
-        self.filament_cost_label = ttk.Label(self.filament_frame, text=self.language_manager.t("gui.materials.cost_per_kg"))
-        self.filament_cost_label.grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.vars['filament_cost_per_kg'] = tk.StringVar()
-        self.filament_cost_entry = ttk.Entry(self.filament_frame, textvariable=self.vars['filament_cost_per_kg'], 
-                                           width=25, state="readonly")
-        self.filament_cost_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=2, padx=(10, 0))
-        
-        self.filament_amount_label = ttk.Label(self.filament_frame, text=self.language_manager.t("gui.materials.amount"))
-        self.filament_amount_label.grid(row=2, column=0, sticky=tk.W, pady=2)
-        self.vars['filament_amount'] = tk.StringVar()
-        ttk.Entry(self.filament_frame, textvariable=self.vars['filament_amount'], width=25).grid(row=2, column=1, sticky=(tk.W, tk.E), pady=2, padx=(10, 0))
+        self.filament_cost_label, self.filament_cost_entry = self._entry_row(
+            self.filament_frame, 1, "gui.materials.cost_per_kg", 'filament_cost_per_kg', state="readonly",
+            bound=True)
+        
+        self.filament_amount_label, _ = self._entry_row(self.filament_frame, 2, "gui.materials.amount", 'filament_amount')
         
         self.filament_frame.columnconfigure(1, weight=1)
         
@@ -1488,18 +1556,16 @@ class PrintCalculatorGUI:
         self.update_filament_combo()
         
         # Printer information
-        self.printer_frame = ttk.LabelFrame(parent, text=self.language_manager.t("gui.printer.title"), padding="10")
+        self.printer_frame = ttk.LabelFrame(parent, text=t("gui.printer.title"), padding="10")
         self.printer_frame.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5, padx=5)
         
         # Printer selection with buttons
-        self.printer_label = ttk.Label(self.printer_frame, text=self.language_manager.t("gui.printer.printer"))
-        self.printer_label.grid(row=0, column=0, sticky=tk.W, pady=2)
-        
         printer_select_frame = ttk.Frame(self.printer_frame)
         printer_select_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=2)
         
         # Printer label in select frame
-        ttk.Label(printer_select_frame, text=self.language_manager.t("gui.printer.printer")).grid(row=0, column=0, sticky=tk.W, pady=2)
+        self.printer_label = ttk.Label(printer_select_frame, text=t("gui.printer.printer"))
+        self.printer_label.grid(row=0, column=0, sticky=tk.W, pady=2)
         
         # Printer dropdown
         self.vars['printer_name'] = tk.StringVar()
@@ -1522,11 +1588,8 @@ class PrintCalculatorGUI:
         printer_select_frame.columnconfigure(1, weight=1)
         
         # Printer power (automatically filled)
-        self.printer_power_label = ttk.Label(self.printer_frame, text=self.language_manager.t("gui.printer.power"))
-        self.printer_power_label.grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.vars['printer_power'] = tk.StringVar()
-        power_entry = ttk.Entry(self.printer_frame, textvariable=self.vars['printer_power'], width=25, state="readonly")
-        power_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=2, padx=(10, 0))
+        self.printer_power_label, _ = self._entry_row(self.printer_frame, 1, "gui.printer.power", 'printer_power',
+                                                      state="readonly", bound=True)
         
         self.printer_frame.columnconfigure(1, weight=1)
         
@@ -1534,71 +1597,32 @@ class PrintCalculatorGUI:
         self.update_printer_combo()
         
         # Optional additional devices
-        self.dryer_frame = ttk.LabelFrame(parent, text=self.language_manager.t("gui.dryer.title"), padding="10")
+        self.dryer_frame = ttk.LabelFrame(parent, text=t("gui.dryer.title"), padding="10")
         self.dryer_frame.grid(row=3, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5, padx=5)
         
         self.vars['dryer_enabled'] = tk.BooleanVar()
-        self.dryer_checkbox = ttk.Checkbutton(self.dryer_frame, text=self.language_manager.t("gui.dryer.enable"), 
+        self.dryer_checkbox = ttk.Checkbutton(self.dryer_frame, text=t("gui.dryer.enable"), 
                        variable=self.vars['dryer_enabled'],
-                       command=self.toggle_dryer)
+                       command=self.on_dryer_toggled)
         self.dryer_checkbox.grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=2)
         
-        # Dryer selection with buttons
-        self.dryer_label = ttk.Label(self.dryer_frame, text=self.language_manager.t("gui.dryer.dryer"))
-        self.dryer_label.grid(row=1, column=0, sticky=tk.W, pady=2)
-        
-        dryer_select_frame = ttk.Frame(self.dryer_frame)
-        dryer_select_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=2)
-        
-        # Dryer label in select frame
-        ttk.Label(dryer_select_frame, text=self.language_manager.t("gui.dryer.dryer")).grid(row=0, column=0, sticky=tk.W, pady=2)
-        
-        # Dryer dropdown
+        # Selection and power field are built when the dryer is first enabled
         self.vars['dryer_name'] = tk.StringVar()
-        self.dryer_combo = ttk.Combobox(dryer_select_frame, textvariable=self.vars['dryer_name'], 
-                                       state="disabled", width=18)
-        self.dryer_combo.grid(row=0, column=1, sticky=(tk.W, tk.E), pady=2, padx=(10, 5))
-        self.dryer_combo.bind('<<ComboboxSelected>>', self.on_dryer_selected)
-        
-        # Button frame for Add/Remove buttons
-        dryer_button_frame = ttk.Frame(dryer_select_frame)
-        dryer_button_frame.grid(row=0, column=2, pady=2, padx=(5, 0))
-        
-        self.add_dryer_button = ttk.Button(dryer_button_frame, text="+", 
-                                         command=self.add_new_dryer, width=2, state="disabled")
-        self.add_dryer_button.grid(row=0, column=0, padx=(0, 2))
-        
-        self.remove_dryer_button = ttk.Button(dryer_button_frame, text="−", 
-                                            command=self.remove_dryer, width=2, state="disabled")
-        self.remove_dryer_button.grid(row=0, column=1, padx=(2, 0))
-        
-        dryer_select_frame.columnconfigure(1, weight=1)
-        
-        # Dryer power (automatically filled)
-        self.dryer_power_label = ttk.Label(self.dryer_frame, text=self.language_manager.t("gui.dryer.power"))
-        self.dryer_power_label.grid(row=2, column=0, sticky=tk.W, pady=2)
         self.vars['dryer_power'] = tk.StringVar()
-        self.dryer_power_entry = ttk.Entry(self.dryer_frame, textvariable=self.vars['dryer_power'], 
-                                          width=25, state="disabled")
-        self.dryer_power_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=2, padx=(10, 0))
-        
         self.dryer_frame.columnconfigure(1, weight=1)
         
         # Initialize dryer dropdown
         self.update_dryer_combo()
         
         # Cost section
-        self.costs_frame = ttk.LabelFrame(parent, text=self.language_manager.t("gui.electricity.title"), padding="10")
+        self.costs_frame = ttk.LabelFrame(parent, text=t("gui.electricity.title"), padding="10")
         self.costs_frame.grid(row=3, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5, padx=5)
         
-        self.electricity_rate_label = ttk.Label(self.costs_frame, text=self.language_manager.t("gui.electricity.rate"))
-        self.electricity_rate_label.grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.vars['electricity_cost'] = tk.StringVar()
-        ttk.Entry(self.costs_frame, textvariable=self.vars['electricity_cost'], width=25).grid(row=0, column=1, sticky=(tk.W, tk.E), pady=2, padx=(10, 0))
+        self.electricity_rate_label, _ = self._entry_row(self.costs_frame, 0, "gui.electricity.rate", 'electricity_cost')
         
-        self.wear_cost_label = ttk.Label(self.costs_frame, text=self.language_manager.t("gui.electricity.wear_cost"))
+        self.wear_cost_label = ttk.Label(self.costs_frame, text=t("gui.electricity.wear_cost"))
         self.wear_cost_label.grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.vars['wear_cost_display'] = tk.StringVar(value=self.language_manager.t("gui.status.please_calculate"))
+        self.vars['wear_cost_display'] = tk.StringVar(value=t("gui.status.please_calculate"))
         wear_display = ttk.Label(self.costs_frame, textvariable=self.vars['wear_cost_display'], 
                                foreground="black", font=("Arial", 9))
         wear_display.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=2, padx=(10, 0))
@@ -1608,28 +1632,82 @@ class PrintCalculatorGUI:
         # Cost overview directly after input fields
         self.setup_result_section(parent, start_row=4)
         
-        # Bind Enter key for automatic calculation
-        for var in self.vars.values():
-            if isinstance(var, tk.StringVar):
-                var.trace_add('write', self.on_input_change)
+        # Numeric entries reject keystrokes that can never form a number
+        validate_number = (self.root.register(_is_partial_number), '%P')
+        validate_integer = (self.root.register(_is_partial_integer), '%P')
+        for key in _NUMERIC_FIELDS:
+            validatecommand = validate_integer if key in _INTEGER_FIELDS else validate_number
+            self.entries[key].configure(validate='key', validatecommand=validatecommand)
+        
+        # Input changes are handled when an entry is left or confirmed, not per keystroke,
+        # and when a dropdown selection is made
+        pending = [parent]
+        while pending:
+            widget = pending.pop()
+            pending.extend(widget.winfo_children())
+            if type(widget) is ttk.Entry:
+                widget.bind('<FocusOut>', self.schedule_input_change)
+                widget.bind('<Return>', self.schedule_input_change)
+            elif type(widget) is ttk.Combobox:
+                widget.bind('<<ComboboxSelected>>', self.schedule_input_change, add='+')
+    
+    def _entry_row(self, parent, row, label_key, key, width=25, state="normal", value="", bound=False):
+        """Creates a label/entry row stored in self.entries, returns (label, entry)
+        
+        bound=True ties the entry to self.vars[key] (a new StringVar unless it exists)
+        """
+        label = ttk.Label(parent, text=self.language_manager.t(label_key))
+        label.grid(row=row, column=0, sticky=tk.W, pady=2)
+        if bound:
+            if key not in self.vars:
+                self.vars[key] = tk.StringVar(value=value)
+            entry = ttk.Entry(parent, textvariable=self.vars[key], width=width, state=state)
+        else:
+            entry = ttk.Entry(parent, width=width, state=state)
+            entry.insert(0, value)
+        entry.grid(row=row, column=1, sticky=(tk.W, tk.E), pady=2, padx=(10, 0))
+        self.entries[key] = entry
+        return label, entry
+    
+    def _set_entry(self, key, value):
+        """Replaces the text of an entry (key validation is suspended, values from a file are shown as-is)"""
+        entry = self.entries[key]
+        validate = entry.cget('validate')
+        entry.configure(validate='none')
+        entry.delete(0, tk.END)
+        entry.insert(0, _format_number(value))
+        entry.configure(validate=validate)
     
     def setup_result_section(self, parent, start_row=0):
         """Creates the cost overview section"""
+        t = self.language_manager.t
+        
         # Calculate button frame (above results)
         calculate_frame = ttk.Frame(parent)
         calculate_frame.grid(row=start_row, column=0, columnspan=2, sticky=(tk.W, tk.E), padx=5, pady=(5, 10))
         
         # Calculate button - centered and prominent
-        self.calculate_button = ttk.Button(calculate_frame, text=self.language_manager.t("gui.buttons.calculate"), 
+        self.calculate_button = ttk.Button(calculate_frame, text=t("gui.buttons.calculate"), 
                                          command=self.calculate_costs, style='Calculate.TButton')
         self.calculate_button.pack(expand=True, pady=5)
         
         # Result frame
-        self.result_frame = ttk.LabelFrame(parent, text=self.language_manager.t("gui.results.title"), padding="10")
+        self.result_frame = ttk.LabelFrame(parent, text=t("gui.results.title"), padding="10")
         self.result_frame.grid(row=start_row+1, column=0, columnspan=2, sticky=(tk.W, tk.E), padx=5, pady=(0, 0))
         
-        # Result labels
+        # Result labels, built on the first result to show (see update_display)
         self.result_labels = {}
+        self.results_placeholder = ttk.Label(self.result_frame, text=t("gui.status.please_calculate"), foreground="gray")
+        self.results_placeholder.grid(row=0, column=0, sticky=tk.W)
+        
+        self._gui_built = True
+    
+    def _build_result_widgets(self):
+        """Creates the result labels inside the result frame"""
+        t = self.language_manager.t
+        
+        self.results_placeholder.destroy()
+        self.results_placeholder = None
         
         # Two columns for better clarity
         left_frame = ttk.Frame(self.result_frame)
@@ -1642,25 +1720,25 @@ class PrintCalculatorGUI:
         self.result_frame.columnconfigure(1, weight=2)
         
         # Left column - individual costs
-        self.individual_costs_label = ttk.Label(left_frame, text=self.language_manager.t("gui.results.individual_costs"), font=("Arial", 11, "bold"))
+        self.individual_costs_label = ttk.Label(left_frame, text=t("gui.results.individual_costs"), font=("Arial", 11, "bold"))
         self.individual_costs_label.grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=(0, 5))
         
-        self.filament_cost_title = ttk.Label(left_frame, text=self.language_manager.t("gui.results.material_cost"))
+        self.filament_cost_title = ttk.Label(left_frame, text=t("gui.results.material_cost"))
         self.filament_cost_title.grid(row=1, column=0, sticky=tk.W, pady=2)
         self.result_labels['filament_cost'] = ttk.Label(left_frame, text="--", foreground="gray")
         self.result_labels['filament_cost'].grid(row=1, column=1, sticky=tk.E, pady=2)
         
-        self.electricity_printer_title = ttk.Label(left_frame, text=self.language_manager.t("gui.results.electricity_printer"))
+        self.electricity_printer_title = ttk.Label(left_frame, text=t("gui.results.electricity_printer"))
         self.electricity_printer_title.grid(row=2, column=0, sticky=tk.W, pady=2)
         self.result_labels['electricity_cost_printer'] = ttk.Label(left_frame, text="--", foreground="gray")
         self.result_labels['electricity_cost_printer'].grid(row=2, column=1, sticky=tk.E, pady=2)
         
-        self.electricity_dryer_title = ttk.Label(left_frame, text=self.language_manager.t("gui.results.electricity_dryer"))
+        self.electricity_dryer_title = ttk.Label(left_frame, text=t("gui.results.electricity_dryer"))
         self.electricity_dryer_title.grid(row=3, column=0, sticky=tk.W, pady=2)
         self.result_labels['electricity_cost_dryer'] = ttk.Label(left_frame, text="--", foreground="gray")
         self.result_labels['electricity_cost_dryer'].grid(row=3, column=1, sticky=tk.E, pady=2)
         
-        self.wear_cost_title = ttk.Label(left_frame, text=self.language_manager.t("gui.results.wear_cost"))
+        self.wear_cost_title = ttk.Label(left_frame, text=t("gui.results.wear_cost"))
         self.wear_cost_title.grid(row=4, column=0, sticky=tk.W, pady=2)
         self.result_labels['wear_cost'] = ttk.Label(left_frame, text="--", foreground="gray")
         self.result_labels['wear_cost'].grid(row=4, column=1, sticky=tk.E, pady=2)
@@ -1668,7 +1746,7 @@ class PrintCalculatorGUI:
         left_frame.columnconfigure(1, weight=1)
         
         # Right column - total costs
-        self.total_costs_label = ttk.Label(right_frame, text=self.language_manager.t("gui.results.total_costs"), font=("Arial", 11, "bold"))
+        self.total_costs_label = ttk.Label(right_frame, text=t("gui.results.total_costs"), font=("Arial", 11, "bold"))
         self.total_costs_label.grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=(0, 5))
         
         # Total costs with background
@@ -1676,37 +1754,55 @@ class PrintCalculatorGUI:
         total_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5, padx=5)
         total_frame.configure(style="TFrame")
         
-        self.total_label = ttk.Label(total_frame, text=self.language_manager.t("gui.results.total"), font=("Arial", 12, "bold"))
+        self.total_label = ttk.Label(total_frame, text=t("gui.results.total"), font=("Arial", 12, "bold"))
         self.total_label.grid(row=0, column=0, sticky=tk.W, padx=10, pady=8)
-        self.result_labels['total_cost'] = ttk.Label(total_frame, text=self.language_manager.t("gui.status.please_calculate"), font=("Arial", 12, "bold"), foreground="gray")
+        self.result_labels['total_cost'] = ttk.Label(total_frame, text=t("gui.status.please_calculate"), font=("Arial", 12, "bold"), foreground="gray")
         self.result_labels['total_cost'].grid(row=0, column=1, sticky=tk.E, padx=10, pady=8)
         total_frame.columnconfigure(1, weight=1)
         
         # Cost per model
-        self.per_model_label = ttk.Label(right_frame, text=self.language_manager.t("gui.results.cost_per_model"), font=("Arial", 10))
+        self.per_model_label = ttk.Label(right_frame, text=t("gui.results.cost_per_model"), font=("Arial", 10))
         self.per_model_label.grid(row=2, column=0, sticky=tk.W, pady=(10, 2))
-        self.result_labels['cost_per_model'] = ttk.Label(right_frame, text=self.language_manager.t("gui.status.please_calculate"), font=("Arial", 10), foreground="gray")
+        self.result_labels['cost_per_model'] = ttk.Label(right_frame, text=t("gui.status.please_calculate"), font=("Arial", 10), foreground="gray")
         self.result_labels['cost_per_model'].grid(row=2, column=1, sticky=tk.E, pady=(10, 2))
         
         right_frame.columnconfigure(1, weight=1)
     
+    def _set_combo_values(self, combo, names: tuple):
+        """Sends dropdown values to Tk only if the manager's cached name tuple changed"""
+        if self._combo_values.get(combo) is not names:
+            combo['values'] = names
+            self._combo_values[combo] = names
+    
+    def _set_state(self, widget, state: str):
+        """Sets a widget's state, skipping the Tk call when it is already in that state"""
+        if self._widget_states.get(widget) != state:
+            widget.config(state=state)
+            self._widget_states[widget] = state
+    
+    def _refresh_combo(self, combo, names, name_key, side_key, on_select, remove_button, enable_remove=True):
+        """Refreshes a catalog dropdown, keeping a valid selection (else the first entry) and clearing it when empty"""
+        if combo is not None:
+            self._set_combo_values(combo, names)
+        
+        name_var = self.vars[name_key]
+        if names:
+            if name_var.get() not in names:
+                name_var.set(names[0])
+                on_select()  # Update the side field
+            state = "normal" if enable_remove else "disabled"
+        else:
+            name_var.set('')
+            self.vars[side_key].set('')
+            state = "disabled"
+        
+        if remove_button is not None:
+            self._set_state(remove_button, state)
+    
     def update_filament_combo(self):
         """Updates the filament dropdown list"""
-        filament_names = self.filament_manager.get_filament_names()
-        self.filament_combo['values'] = filament_names
-        
-        # Select first entry by default, if available
-        if filament_names:
-            current_selection = self.vars['filament_name'].get()
-            if not current_selection or current_selection not in filament_names:
-                self.vars['filament_name'].set(filament_names[0])
-                self.on_filament_selected()  # Update price
-            # Enable remove button
-            self.remove_filament_button.config(state="normal")
-        else:
-            self.vars['filament_name'].set('')
-            # Disable remove button
-            self.remove_filament_button.config(state="disabled")
+        self._refresh_combo(self.filament_combo, self.filament_manager.get_filament_names(), 'filament_name',
+                            'filament_cost_per_kg', self.on_filament_selected, self.remove_filament_button)
     
     def on_filament_selected(self, event=None):
         """Called when a filament is selected"""
@@ -1719,10 +1815,11 @@ class PrintCalculatorGUI:
         """Dialog for adding a new filament"""
         dialog = FilamentDialog(self.root, self.filament_manager, self.language_manager)
         if dialog.result:
-            self.update_filament_combo()
-            # Select new filament
+            # Select new filament first, so the combo update keeps it and doesn't fill in a default
             self.vars['filament_name'].set(dialog.result.name)
+            self.update_filament_combo()
             self.on_filament_selected()
+            self.schedule_input_change()
     
     def remove_filament(self):
         """Removes the currently selected filament"""
@@ -1737,30 +1834,12 @@ class PrintCalculatorGUI:
                                  self.language_manager.t("messages.confirmation.remove_filament_message", name=selected_name)):
             self.filament_manager.remove_filament(selected_name)
             self.update_filament_combo()
-            
-            # Check if filaments are still available
-            filament_names = self.filament_manager.get_filament_names()
-            if not filament_names:
-                self.remove_filament_button.config(state="disabled")
-                self.vars['filament_cost_per_kg'].set("")
+            self.schedule_input_change()
     
     def update_printer_combo(self):
         """Updates the printer dropdown list"""
-        printer_names = self.printer_manager.get_printer_names()
-        self.printer_combo['values'] = printer_names
-        
-        # Select first entry by default, if available
-        if printer_names:
-            current_selection = self.vars['printer_name'].get()
-            if not current_selection or current_selection not in printer_names:
-                self.vars['printer_name'].set(printer_names[0])
-                self.on_printer_selected()  # Update power
-            # Enable remove button
-            self.remove_printer_button.config(state="normal")
-        else:
-            self.vars['printer_name'].set('')
-            # Disable remove button
-            self.remove_printer_button.config(state="disabled")
+        self._refresh_combo(self.printer_combo, self.printer_manager.get_printer_names(), 'printer_name',
+                            'printer_power', self.on_printer_selected, self.remove_printer_button)
     
     def on_printer_selected(self, event=None):
         """Called when a printer is selected"""
@@ -1773,10 +1852,11 @@ class PrintCalculatorGUI:
         """Dialog for adding a new printer"""
         dialog = PrinterDialog(self.root, self.printer_manager, self.language_manager)
         if dialog.result:
-            self.update_printer_combo()
-            # Select new printer
+            # Select new printer first, so the combo update keeps it and doesn't fill in a default
             self.vars['printer_name'].set(dialog.result.name)
+            self.update_printer_combo()
             self.on_printer_selected()
+            self.schedule_input_change()
     
     def remove_printer(self):
         """Removes the currently selected printer"""
@@ -1791,31 +1871,13 @@ class PrintCalculatorGUI:
                                  self.language_manager.t("messages.confirmation.remove_printer_message", name=selected_name)):
             self.printer_manager.remove_printer(selected_name)
             self.update_printer_combo()
-            
-            # Check if printers are still available
-            printer_names = self.printer_manager.get_printer_names()
-            if not printer_names:
-                self.remove_printer_button.config(state="disabled")
-                self.vars['printer_power'].set("")
+            self.schedule_input_change()
     
     def update_dryer_combo(self):
-        """Updates the dryer dropdown list"""
-        dryer_names = self.dryer_manager.get_dryer_names()
-        self.dryer_combo['values'] = dryer_names
-        
-    # Select first entry by default, if available
-        if dryer_names:
-            current_selection = self.vars['dryer_name'].get()
-            if not current_selection or current_selection not in dryer_names:
-                self.vars['dryer_name'].set(dryer_names[0])
-                self.on_dryer_selected()  # Update power
-            # Enable remove button if dryer is enabled
-            if self.vars['dryer_enabled'].get():
-                self.remove_dryer_button.config(state="normal")
-        else:
-            self.vars['dryer_name'].set('')
-            # Disable remove button
-            self.remove_dryer_button.config(state="disabled")
+        """Updates the dryer dropdown list (the widgets exist once the dryer was first enabled)"""
+        self._refresh_combo(getattr(self, 'dryer_combo', None), self.dryer_manager.get_dryer_names(), 'dryer_name',
+                            'dryer_power', self.on_dryer_selected, getattr(self, 'remove_dryer_button', None),
+                            enable_remove=self.vars['dryer_enabled'].get())
     
     def on_dryer_selected(self, event=None):
         """Called when a dryer is selected"""
@@ -1828,10 +1890,11 @@ class PrintCalculatorGUI:
         """Dialog for adding a new dryer"""
         dialog = DryerDialog(self.root, self.dryer_manager, self.language_manager)
         if dialog.result:
-            self.update_dryer_combo()
-            # Select new dryer
+            # Select new dryer first, so the combo update keeps it and doesn't fill in a default
             self.vars['dryer_name'].set(dialog.result.name)
+            self.update_dryer_combo()
             self.on_dryer_selected()
+            self.schedule_input_change()
     
     def remove_dryer(self):
         """Removes the currently selected dryer"""
@@ -1846,49 +1909,44 @@ class PrintCalculatorGUI:
                                  self.language_manager.t("messages.confirmation.remove_dryer_message", name=selected_name)):
             self.dryer_manager.remove_dryer(selected_name)
             self.update_dryer_combo()
-            
-            # Check if dryers are still available
-            dryer_names = self.dryer_manager.get_dryer_names()
-            if not dryer_names:
-                self.remove_dryer_button.config(state="disabled")
-                self.vars['dryer_power'].set("")
+            self.schedule_input_change()
+    
+    def _set_window_title(self, title: str):
+        """Sets the window title, skipping the window manager call when it is unchanged"""
+        if title != self._window_title:
+            self._window_title = title
+            self.root.title(title)
+    
+    def _set_cost_label(self, name: str, value: float, color: str):
+        """Shows a cost in its result label (gray when zero), skipped when text and color are unchanged"""
+        state = (_COST_FORMAT(value), color if value > 0 else "gray")
+        if self._cost_label_state.get(name) != state:
+            self._cost_label_state[name] = state
+            self.result_labels[name].config(text=state[0], foreground=state[1])
     
     def update_display(self):
         """Updates the display of calculated costs"""
-        # Update result labels
-        if hasattr(self, 'result_labels'):
-            # Update values and colors
-            self.result_labels['filament_cost'].config(
-                text=f"{self.current_project.filament_cost:.4f} €", 
-                foreground="blue" if self.current_project.filament_cost > 0 else "gray"
-            )
-            self.result_labels['electricity_cost_printer'].config(
-                text=f"{self.current_project.electricity_cost_printer:.4f} €", 
-                foreground="blue" if self.current_project.electricity_cost_printer > 0 else "gray"
-            )
-            self.result_labels['electricity_cost_dryer'].config(
-                text=f"{self.current_project.electricity_cost_dryer:.4f} €", 
-                foreground="blue" if self.current_project.electricity_cost_dryer > 0 else "gray"
-            )
-            self.result_labels['wear_cost'].config(
-                text=f"{self.current_project.wear_cost:.4f} €", 
-                foreground="blue" if self.current_project.wear_cost > 0 else "gray"
-            )
-            self.result_labels['total_cost'].config(
-                text=f"{self.current_project.total_cost:.4f} €", 
-                foreground="darkgreen" if self.current_project.total_cost > 0 else "gray"
-            )
+        # Update result labels, unless the results have not changed since they were last shown
+        if self._gui_built and self._rendered_version != self._results_version:
+            self._rendered_version = self._results_version
+            project = self.current_project
             
-            # Update wear display in cost section
-            if hasattr(self, 'vars') and 'wear_cost_display' in self.vars:
-                self.vars['wear_cost_display'].set(f"{self.current_project.wear_cost:.4f} €")
+            # The result widgets are created once there is a result worth showing
+            if not self.result_labels and project.total_cost > 0:
+                self._build_result_widgets()
+            
+            if self.result_labels:
+                cost_per_model = project.total_cost / max(1, project.model_count)
+                set_cost = self._set_cost_label
+                set_cost('filament_cost', project.filament_cost, "blue")
+                set_cost('electricity_cost_printer', project.electricity_cost_printer, "blue")
+                set_cost('electricity_cost_dryer', project.electricity_cost_dryer, "blue")
+                set_cost('wear_cost', project.wear_cost, "blue")
+                set_cost('total_cost', project.total_cost, "darkgreen")
+                set_cost('cost_per_model', cost_per_model, "darkgreen")
             
-            # Cost per model
-            cost_per_model = self.current_project.total_cost / max(1, self.current_project.model_count)
-            self.result_labels['cost_per_model'].config(
-                text=f"{cost_per_model:.4f} €", 
-                foreground="darkgreen" if cost_per_model > 0 else "gray"
-            )
+            # Update wear display in cost section
+            self.vars['wear_cost_display'].set(_COST_FORMAT(project.wear_cost))
         
         # Update window title
         title = "3D-Print CostCulator v1.0"
@@ -1896,27 +1954,24 @@ class PrintCalculatorGUI:
             title += f" - {self.current_project.project_name}"
         if self.current_file_path:
             title += f" ({os.path.basename(self.current_file_path)})"
-        self.root.title(title)
+        self._set_window_title(title)
         
         # Update button states
         self.update_button_states()
-        
-        # Force update the display
-        self.root.update_idletasks()
     
     def load_project_data(self):
         """Loads current project data into the GUI fields"""
         if hasattr(self, 'vars'):
-            self.vars['project_name'].set(self.current_project.project_name)
-            self.vars['model_name'].set(self.current_project.model_name)
-            self.vars['model_count'].set(str(self.current_project.model_count))
-            self.vars['print_duration'].set(str(self.current_project.print_duration))
+            self._set_entry('project_name', self.current_project.project_name)
+            self._set_entry('model_name', self.current_project.model_name)
+            self._set_entry('model_count', self.current_project.model_count)
+            self._set_entry('print_duration', self.current_project.print_duration)
             self.vars['filament_name'].set(self.current_project.filament_name)
-            self.vars['filament_amount'].set(str(self.current_project.filament_amount))
+            self._set_entry('filament_amount', self.current_project.filament_amount)
             self.vars['filament_cost_per_kg'].set(str(self.current_project.filament_cost_per_kg))
             self.vars['printer_name'].set(self.current_project.printer_name)  # Newly added
             self.vars['printer_power'].set(str(self.current_project.printer_power))
-            self.vars['electricity_cost'].set(str(self.current_project.electricity_cost))
+            self._set_entry('electricity_cost', self.current_project.electricity_cost)
             self.vars['dryer_enabled'].set(self.current_project.dryer_enabled)
             self.vars['dryer_name'].set(self.current_project.dryer_name)
             self.vars['dryer_power'].set(str(self.current_project.dryer_power))
@@ -1926,158 +1981,180 @@ class PrintCalculatorGUI:
             self.on_printer_selected()  # Update printer power field
             self.on_dryer_selected()  # Update dryer power field
     
-    def save_project_data(self):
-        """Saves GUI data to the current project"""
+    # Project fields read by save_project_data and checked by validate_required_fields:
+    # plain text, required text with its error key, and non-negative numbers with their
+    # label key and the error key for a missing (non-positive) value
+    _TEXT_FIELDS = ('project_name', 'model_name', 'filament_name', 'printer_name', 'dryer_name')
+    _REQUIRED_TEXT_FIELDS = (
+        ('project_name', "messages.error.project_name_required"),
+        ('model_name', "messages.error.model_name_required"),
+    )
+    _NUMBER_FIELDS = (
+        ('print_duration', "gui.project.print_duration", "messages.error.print_duration_invalid"),
+        ('filament_amount', "gui.materials.amount", "messages.error.filament_amount_invalid"),
+        ('filament_cost_per_kg', "gui.materials.cost_per_kg", "messages.error.cost_required"),
+        ('printer_power', "gui.printer.power", "messages.error.power_required"),
+        ('electricity_cost', "gui.electricity.rate", "messages.error.electricity_rate_invalid"),
+        ('dryer_power', "gui.dryer.power", "messages.error.power_required"),  # Only required with the dryer enabled
+    )
+    
+    def _field_text(self, key: str) -> str:
+        """Current text of an input field, from its StringVar if it has one, else from its entry"""
+        var = self.vars.get(key)
+        return (var if var is not None else self.entries[key]).get()
+    
+    def save_project_data(self, quiet: bool = False):
+        """Saves GUI data to the current project (quiet=True reports invalid input only through the return value)"""
         try:
             if hasattr(self, 'vars'):
+                project = self.current_project
+                
                 # Validate and set project data
-                self.current_project.project_name = self.vars['project_name'].get().strip()
-                self.current_project.model_name = self.vars['model_name'].get().strip()
+                for key in self._TEXT_FIELDS:
+                    setattr(project, key, self._field_text(key).strip())
                 
                 # Validate numeric inputs
-                model_count_str = self.vars['model_count'].get().strip()
+                model_count_str = self.entries['model_count'].get().strip()
                 if model_count_str:
                     model_count = int(model_count_str)
                     if model_count < 1:
                         raise ValueError(self.language_manager.t("messages.error.model_count_invalid"))
-                    self.current_project.model_count = model_count
-                else:
-                    self.current_project.model_count = 1
-                
-                # Print duration
-                duration_str = self.vars['print_duration'].get().strip()
-                if duration_str:
-                    duration = float(duration_str.replace(',', '.'))
-                    if duration < 0:
-                        raise ValueError(self.language_manager.t("messages.validation.negative_value", field=self.language_manager.t("gui.project.print_duration")))
-                    self.current_project.print_duration = duration
-                else:
-                    self.current_project.print_duration = 0.0
-                
-                self.current_project.filament_name = self.vars['filament_name'].get().strip()
-                
-                # Filament amount
-                amount_str = self.vars['filament_amount'].get().strip()
-                if amount_str:
-                    amount = float(amount_str.replace(',', '.'))
-                    if amount < 0:
-                        raise ValueError(self.language_manager.t("messages.validation.negative_value", field=self.language_manager.t("gui.materials.amount")))
-                    self.current_project.filament_amount = amount
-                else:
-                    self.current_project.filament_amount = 0.0
-                
-                # Filament costs
-                cost_str = self.vars['filament_cost_per_kg'].get().strip()
-                if cost_str:
-                    cost = float(cost_str.replace(',', '.'))
-                    if cost < 0:
-                        raise ValueError(self.language_manager.t("messages.validation.negative_value", field=self.language_manager.t("gui.materials.cost_per_kg")))
-                    self.current_project.filament_cost_per_kg = cost
+                    project.model_count = model_count
                 else:
-                    self.current_project.filament_cost_per_kg = 0.0
-                
-                # Printer name
-                self.current_project.printer_name = self.vars['printer_name'].get().strip()
+                    project.model_count = 1
                 
-                # Printer power
-                power_str = self.vars['printer_power'].get().strip()
-                if power_str:
-                    power = float(power_str.replace(',', '.'))
-                    if power < 0:
-                        raise ValueError(self.language_manager.t("messages.validation.negative_value", field=self.language_manager.t("gui.printer.power")))
-                    self.current_project.printer_power = power
-                else:
-                    self.current_project.printer_power = 0.0
+                for key, label_key, _ in self._NUMBER_FIELDS:
+                    setattr(project, key, self._read_number(self._field_text(key), label_key))
                 
-                # Electricity costs
-                elec_str = self.vars['electricity_cost'].get().strip()
-                if elec_str:
-                    elec_cost = float(elec_str.replace(',', '.'))
-                    if elec_cost < 0:
-                        raise ValueError(self.language_manager.t("messages.validation.negative_value", field=self.language_manager.t("gui.electricity.rate")))
-                    self.current_project.electricity_cost = elec_cost
-                else:
-                    self.current_project.electricity_cost = 0.0
-                
-                self.current_project.dryer_enabled = self.vars['dryer_enabled'].get()
-                
-                # Dryer name
-                self.current_project.dryer_name = self.vars['dryer_name'].get().strip()
-                
-                # Dryer power
-                dryer_power_str = self.vars['dryer_power'].get().strip()
-                if dryer_power_str:
-                    dryer_power = float(dryer_power_str.replace(',', '.'))
-                    if dryer_power < 0:
-                        raise ValueError(self.language_manager.t("messages.validation.negative_value", field=self.language_manager.t("gui.dryer.power")))
-                    self.current_project.dryer_power = dryer_power
-                else:
-                    self.current_project.dryer_power = 0.0
+                project.dryer_enabled = self.vars['dryer_enabled'].get()
                 
                 # Set wear_cost_percent to 0 (not used anymore since it's calculated automatically)
-                self.current_project.wear_cost_percent = 0.0
+                project.wear_cost_percent = 0.0
                     
         except ValueError as e:
-            messagebox.showerror(self.language_manager.t("messages.error.title"), f"{self.language_manager.t('messages.error.invalid_input')}: {str(e)}")
+            if not quiet:
+                messagebox.showerror(self.language_manager.t("messages.error.title"), f"{self.language_manager.t('messages.error.invalid_input')}: {str(e)}")
             return False
         except Exception as e:
-            messagebox.showerror(self.language_manager.t("messages.error.title"), f"{self.language_manager.t('messages.error.save_error')}: {str(e)}")
+            if not quiet:
+                messagebox.showerror(self.language_manager.t("messages.error.title"), f"{self.language_manager.t('messages.error.save_error')}: {str(e)}")
             return False
         return True
     
+    def _read_number(self, text: str, label_key: str) -> float:
+        """Parses a non-negative number field (decimal comma or point), empty means 0"""
+        text = text.strip()
+        if not text:
+            return 0.0
+        value = float(text.translate(_COMMA_DOT))
+        if value < 0:
+            raise ValueError(self.language_manager.t("messages.validation.negative_value", field=self.language_manager.t(label_key)))
+        return value
+    
     def validate_required_fields(self):
         """Checks if all required fields are filled"""
-        errors = []
+        project = self.current_project
+        t = self.language_manager.t
+        errors = [t(error_key) for key, error_key in self._REQUIRED_TEXT_FIELDS if not getattr(project, key)]
         
-        if not self.current_project.project_name:
-            errors.append(self.language_manager.t("messages.error.project_name_required"))
+        for key, _, error_key in self._NUMBER_FIELDS:
+            if getattr(project, key) <= 0 and (key != 'dryer_power' or project.dryer_enabled):
+                errors.append(t(error_key))
         
-        if not self.current_project.model_name:
-            errors.append(self.language_manager.t("messages.error.model_name_required"))
+        return errors
+    
+    def _build_dryer_widgets(self):
+        """Creates the dryer selection and power field (on first enable)"""
+        t = self.language_manager.t
         
-        if self.current_project.print_duration <= 0:
-            errors.append(self.language_manager.t("messages.error.print_duration_invalid"))
+        # Dryer selection with buttons
+        dryer_select_frame = ttk.Frame(self.dryer_frame)
+        dryer_select_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=2)
+        
+        # Dryer label in select frame
+        self.dryer_label = ttk.Label(dryer_select_frame, text=t("gui.dryer.dryer"))
+        self.dryer_label.grid(row=0, column=0, sticky=tk.W, pady=2)
+        
+        # Dryer dropdown
+        self.dryer_combo = ttk.Combobox(dryer_select_frame, textvariable=self.vars['dryer_name'], 
+                                       state="readonly", width=18)
+        self.dryer_combo.grid(row=0, column=1, sticky=(tk.W, tk.E), pady=2, padx=(10, 5))
+        self.dryer_combo.bind('<<ComboboxSelected>>', self.on_dryer_selected)
+        self.dryer_combo.bind('<<ComboboxSelected>>', self.schedule_input_change, add='+')
         
-        if self.current_project.filament_amount <= 0:
-            errors.append(self.language_manager.t("messages.error.filament_amount_invalid"))
+        # Button frame for Add/Remove buttons
+        dryer_button_frame = ttk.Frame(dryer_select_frame)
+        dryer_button_frame.grid(row=0, column=2, pady=2, padx=(5, 0))
         
-        if self.current_project.filament_cost_per_kg <= 0:
-            errors.append(self.language_manager.t("messages.error.cost_required"))
+        self.add_dryer_button = ttk.Button(dryer_button_frame, text="+", 
+                                         command=self.add_new_dryer, width=2)
+        self.add_dryer_button.grid(row=0, column=0, padx=(0, 2))
         
-        if self.current_project.printer_power <= 0:
-            errors.append(self.language_manager.t("messages.error.power_required"))
+        self.remove_dryer_button = ttk.Button(dryer_button_frame, text="−", 
+                                            command=self.remove_dryer, width=2, state="disabled")
+        self.remove_dryer_button.grid(row=0, column=1, padx=(2, 0))
         
-        if self.current_project.electricity_cost <= 0:
-            errors.append(self.language_manager.t("messages.error.electricity_rate_invalid"))
+        dryer_select_frame.columnconfigure(1, weight=1)
         
-        if self.current_project.dryer_enabled and self.current_project.dryer_power <= 0:
-            errors.append(self.language_manager.t("messages.error.power_required"))
+        # Dryer power (automatically filled)
+        self.dryer_power_label, self.dryer_power_entry = self._entry_row(
+            self.dryer_frame, 2, "gui.dryer.power", 'dryer_power', state="readonly", bound=True)
+        self._dryer_widgets = (dryer_select_frame, self.dryer_power_label, self.dryer_power_entry)
         
-        return errors
+        # Only the values: the current selection and power may come from a loaded project and
+        # must not be replaced (toggle_dryer sets the remove button state)
+        self._set_combo_values(self.dryer_combo, self.dryer_manager.get_dryer_names())
     
     def toggle_dryer(self):
-        """Enables/disables the dryer input field and buttons"""
-        enabled = self.vars['dryer_enabled'].get()
-        
-        if hasattr(self, 'dryer_power_entry'):
-            if enabled:
-                self.dryer_power_entry.config(state="readonly")
-                self.dryer_combo.config(state="readonly")
-                self.add_dryer_button.config(state="normal")
-                # Only enable remove button if dryer is selected
-                dryer_names = self.dryer_manager.get_dryer_names()
-                if dryer_names and self.vars['dryer_name'].get():
-                    self.remove_dryer_button.config(state="normal")
+        """Shows/hides the dryer selection and power field"""
+        if self.vars['dryer_enabled'].get():
+            if hasattr(self, 'dryer_combo'):
+                for widget in self._dryer_widgets:
+                    widget.grid()
             else:
-                self.dryer_power_entry.config(state="disabled")
-                self.dryer_combo.config(state="disabled")
-                self.add_dryer_button.config(state="disabled")
-                self.remove_dryer_button.config(state="disabled")
+                self._build_dryer_widgets()
+            # Only enable remove button if dryer is selected
+            dryer_names = self.dryer_manager.get_dryer_names()
+            state = "normal" if dryer_names and self.vars['dryer_name'].get() else "disabled"
+            self._set_state(self.remove_dryer_button, state)
+        elif hasattr(self, 'dryer_combo'):
+            # grid_remove keeps the grid options for showing them again
+            for widget in self._dryer_widgets:
+                widget.grid_remove()
+    
+    def on_dryer_toggled(self):
+        """Dryer checkbox command: updates the dryer fields and recalculates"""
+        self.toggle_dryer()
+        self.schedule_input_change()
+    
+    def schedule_input_change(self, *args):
+        """Debounces input events (Return followed by focus-out), on_input_change runs once"""
+        if self._input_after_id is not None:
+            self.root.after_cancel(self._input_after_id)
+        self._input_after_id = self.root.after(self.INPUT_DEBOUNCE_MS, self._run_input_change)
+    
+    def _run_input_change(self):
+        """Runs the debounced input change"""
+        self._input_after_id = None
+        self.on_input_change()
     
     def on_input_change(self, *args):
-        """Called when an input value changes"""
-        # Auto-calculate when input changes (with delay to avoid constant calculation)
-        pass
+        """Called (debounced) when an input value changes, recalculates silently once the input is complete"""
+        previous_total = self.current_project.total_cost
+        
+        # Incomplete input is reported by the calculate button, not while the user is still typing
+        if self.save_project_data(quiet=True) and not self.validate_required_fields():
+            # Silent: the result labels show the new total, the status text is only formatted by calculate_costs
+            self.current_project = CostCulator.calculate_total_costs(self.current_project)
+        else:
+            # The (possibly partly written) input no longer matches the shown results
+            CostCulator.clear_results(self.current_project)
+        self._results_version += 1
+        
+        if self.current_project.total_cost != previous_total and self._status[0] == "status.calculation_complete":
+            # The total in the status message is out of date
+            self.set_status("status.ready")
+        self.update_display()
     
     def calculate_costs(self):
         """Calculates the costs for the current project"""
@@ -2094,32 +2171,40 @@ class PrintCalculatorGUI:
         try:
             # Perform calculation
             self.current_project = CostCulator.calculate_total_costs(self.current_project)
+            self._results_version += 1
             
             # Update display
             self.update_display()
             
-            # Success highlight: briefly highlight total cost
-            original_color = self.result_labels['total_cost'].cget('foreground')
+            # Success highlight: briefly highlight total cost (a repeated click restarts it)
+            if self._highlight_after_id is not None:
+                self.root.after_cancel(self._highlight_after_id)
             self.result_labels['total_cost'].config(foreground='green')
-            self.root.after(1500, lambda: self.result_labels['total_cost'].config(foreground=original_color))
+            self._highlight_after_id = self.root.after(1500, self._end_highlight)
             
-            self.status_var.set(self.language_manager.t("status.calculation_complete", cost=f"{self.current_project.total_cost:.4f}"))
+            self.set_status("status.calculation_complete", cost=f"{self.current_project.total_cost:.4f}")
         except Exception as e:
             messagebox.showerror(self.language_manager.t("messages.error.title"), 
                                 f"{self.language_manager.t('messages.error.calculation_error')}: {str(e)}")
-            self.status_var.set(self.language_manager.t("status.calculation_error"))
+            self.set_status("status.calculation_error")
     
-    def new_project(self):
+    def _end_highlight(self):
+        """Restores the total cost color after the success highlight"""
+        self._highlight_after_id = None
+        self.result_labels['total_cost'].config(foreground=self._cost_label_state['total_cost'][1])
+    
+    def new_project(self, event=None):
         """Creates a new project"""
         if messagebox.askyesno(self.language_manager.t("messages.confirmation.new_project_title"), 
                               self.language_manager.t("messages.confirmation.new_project_message")):
             self.current_project = PrintProject()
+            self._results_version += 1
             self.current_file_path = None
             self.load_project_data()
             self.update_display()
-            self.status_var.set(self.language_manager.t("status.new_project_created"))
+            self.set_status("status.new_project_created")
     
-    def load_project(self):
+    def load_project(self, event=None):
         """Loads a project from a file"""
         file_path = filedialog.askopenfilename(
             title=self.language_manager.t("file_dialogs.load_project_title"),
@@ -2132,6 +2217,7 @@ class PrintCalculatorGUI:
             project = ProjectManager.load_project(file_path)
             if project:
                 self.current_project = project
+                self._results_version += 1
                 self.current_file_path = file_path
                 self.load_project_data()
                 
@@ -2140,9 +2226,9 @@ class PrintCalculatorGUI:
                     self.current_project = CostCulator.calculate_total_costs(self.current_project)
                 
                 self.update_display()
-                self.status_var.set(self.language_manager.t("status.project_loaded", filename=os.path.basename(file_path)))
+                self.set_status("status.project_loaded", filename=os.path.basename(file_path))
     
-    def save_project(self):
+    def save_project(self, event=None):
         """Saves the current project"""
         if not self.current_file_path:
             self.save_project_as()
@@ -2152,9 +2238,9 @@ class PrintCalculatorGUI:
             return
         
         if ProjectManager.save_project(self.current_project, self.current_file_path):
-            self.status_var.set(self.language_manager.t("status.project_saved", filename=os.path.basename(self.current_file_path)))
+            self.set_status("status.project_saved", filename=os.path.basename(self.current_file_path))
     
-    def save_project_as(self):
+    def save_project_as(self, event=None):
         """Saves the current project under a new name"""
         if not self.save_project_data():
             return
@@ -2171,15 +2257,20 @@ class PrintCalculatorGUI:
             if ProjectManager.save_project(self.current_project, file_path):
                 self.current_file_path = file_path
                 self.update_display()
-                self.status_var.set(self.language_manager.t("status.project_saved", filename=os.path.basename(file_path)))
+                self.set_status("status.project_saved", filename=os.path.basename(file_path))
     
-    def export_pdf(self):
+    def export_pdf(self, event=None):
         """Exports the costs as PDF"""
+        # One export at a time (Ctrl+E stays bound while the button is disabled)
+        if self._pdf_future is not None:
+            return
+        
         if not self.save_project_data():
             return
         
     # Calculate costs before export
         self.current_project = CostCulator.calculate_total_costs(self.current_project)
+        self._results_version += 1
         
         file_path = filedialog.asksaveasfilename(
             title=self.language_manager.t("file_dialogs.export_pdf_title"),
@@ -2190,15 +2281,37 @@ class PrintCalculatorGUI:
         )
         
         if file_path:
-            if PDFExporter.export_to_pdf(self.current_project, file_path, self.language_manager):
-                self.status_var.set(self.language_manager.t("status.pdf_exported", filename=os.path.basename(file_path)))
-                if messagebox.askyesno(self.language_manager.t("messages.confirmation.pdf_created_title"), 
-                                     self.language_manager.t("messages.confirmation.pdf_created_message", filepath=file_path)):
-                    try:
-                        os.startfile(file_path)  # Windows
-                    except AttributeError:
-                        import subprocess
-                        subprocess.run(['open', file_path])  # macOS/Linux
+            # Loading reportlab and building the PDF runs on a worker thread, so the window stays
+            # responsive. All texts are resolved here on the Tk thread, the worker only gets plain
+            # data; the result is polled from Tk. One worker per export, shut down as soon as it is done
+            content = PDFExporter.pdf_content(self.current_project, self.language_manager)
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-export")
+            future = executor.submit(PDFExporter.build_pdf, content, file_path)
+            executor.shutdown(wait=False)
+            self._pdf_future = future
+            self._set_state(self.export_pdf_button, "disabled")
+            self.set_status("status.exporting_pdf", filename=os.path.basename(file_path))
+            self.root.after(self.PDF_POLL_MS, self._finish_pdf_export, future, file_path)
+    
+    def _finish_pdf_export(self, future, file_path):
+        """Reports a PDF export once its worker is done (Tk is only touched from the main thread)"""
+        if not future.done():
+            self.root.after(self.PDF_POLL_MS, self._finish_pdf_export, future, file_path)
+            return
+        
+        self._pdf_future = None
+        self.update_button_states()
+        
+        error = future.exception()
+        if error is not None:
+            self.set_status("status.ready")
+            PDFExporter.show_error(error, self.language_manager)
+            return
+        
+        self.set_status("status.pdf_exported", filename=os.path.basename(file_path))
+        if messagebox.askyesno(self.language_manager.t("messages.confirmation.pdf_created_title"), 
+                             self.language_manager.t("messages.confirmation.pdf_created_message", filepath=file_path)):
+            _open_with_default_app(file_path)
     
     def show_about_dialog(self):
         """Shows the about dialog"""
@@ -0,0 +1,79 @@
+"""Tests for the silent recalculation after an input change"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from main import PrintCalculatorGUI, PrintProject
+
+
+class _Window:
+    """Stand-in for the GUI: only what on_input_change uses, without a Tk display"""
+
+    def __init__(self, project):
+        self.current_project = project
+        self.inputs_valid = True
+        self.errors = []
+        self._results_version = 0
+        self._status = ("status.ready", {})
+        self.statuses = []
+
+    def save_project_data(self, quiet=False):
+        return self.inputs_valid
+
+    def validate_required_fields(self):
+        return self.errors
+
+    def set_status(self, key, **kwargs):
+        self._status = (key, kwargs)
+        self.statuses.append(key)
+
+    def update_display(self):
+        pass
+
+    on_input_change = PrintCalculatorGUI.on_input_change
+
+
+def _project(filament_amount):
+    return PrintProject(project_name="P", model_name="M", print_duration=2.0,
+                        filament_amount=filament_amount, filament_cost_per_kg=20.0,
+                        printer_power=100.0, electricity_cost=0.3)
+
+
+class InputChangeTests(unittest.TestCase):
+    def setUp(self):
+        # State after an explicit calculate: the status shows the total
+        self.window = _Window(_project(100.0))
+        self.window.on_input_change()
+        self.window._status = ("status.calculation_complete", {"cost": "x"})
+        self.window.statuses.clear()
+
+    def test_changed_total_resets_status(self):
+        self.window.current_project.filament_amount = 200.0
+        self.window.on_input_change()
+        self.assertEqual(self.window.statuses, ["status.ready"])
+
+    def test_unchanged_total_keeps_status(self):
+        self.window.on_input_change()
+        self.assertEqual(self.window.statuses, [])
+        self.assertEqual(self.window._status[0], "status.calculation_complete")
+
+    def test_invalid_input_clears_results(self):
+        self.window.errors = ["missing"]
+        self.window.on_input_change()
+        self.assertEqual(self.window.current_project.total_cost, 0.0)
+        self.assertEqual(self.window.current_project.filament_cost, 0.0)
+        self.assertEqual(self.window.statuses, ["status.ready"])
+
+    def test_unparsable_input_clears_results(self):
+        self.window.inputs_valid = False
+        version = self.window._results_version
+        self.window.on_input_change()
+        self.assertEqual(self.window.current_project.total_cost, 0.0)
+        self.assertGreater(self.window._results_version, version)
+
+
+if __name__ == "__main__":
+    unittest.main()
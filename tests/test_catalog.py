@@ -0,0 +1,49 @@
+"""Tests for the JSON-backed catalogs"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import main
+from main import FilamentManager
+
+
+class DuplicateNameTests(unittest.TestCase):
+    def setUp(self):
+        # The catalog files are relative to the working directory
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(temp_dir.name)
+        self.addCleanup(main._CATALOG_CACHE.clear)
+
+        rows = [
+            {"name": "A", "cost_per_kg": 1.0},
+            {"name": "A", "cost_per_kg": 2.0},
+            {"name": "a", "cost_per_kg": 3.0},
+            {"name": "B", "cost_per_kg": 4.0},
+        ]
+        with open(FilamentManager.catalog_file, "w", encoding="utf-8") as f:
+            json.dump(rows, f)
+        self.manager = FilamentManager()
+
+    def test_first_duplicate_wins(self):
+        self.assertEqual(self.manager.get_filament_by_name("A").cost_per_kg, 1.0)
+        self.assertEqual(self.manager.get_filament_names(), ("A", "a", "B"))
+
+    def test_removing_duplicate_exposes_the_next(self):
+        self.assertTrue(self.manager.remove_filament("A"))
+        self.assertEqual(self.manager.get_filament_by_name("A").cost_per_kg, 2.0)
+
+        names = self.manager.get_filament_names()
+        self.assertEqual(names, ("A", "a", "B"))
+        self.assertEqual(names.index("B"), 2)
+        self.assertEqual(self.manager.get_filament_by_name("B").cost_per_kg, 4.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
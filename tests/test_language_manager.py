@@ -0,0 +1,59 @@
+"""Tests for the LanguageManager update callbacks"""
+
+import gc
+import os
+import sys
+import unittest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+from language_manager import LanguageManager
+
+
+class _Widget:
+    """Stand-in for a GUI object registering a bound method"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def update_texts(self):
+        self.calls += 1
+
+
+class UpdateCallbackTests(unittest.TestCase):
+    def setUp(self):
+        # Absolute path, so no translations folder is created in the working directory
+        self.manager = LanguageManager(os.path.join(SRC_DIR, "translations"))
+
+    def test_lambda_callback_fires(self):
+        calls = []
+        self.manager.register_update_callback(lambda: calls.append(1))
+        gc.collect()
+        self.manager.notify_update()
+        self.assertEqual(calls, [1])
+
+    def test_function_callback_can_be_unregistered(self):
+        calls = []
+
+        def callback():
+            calls.append(1)
+
+        self.manager.register_update_callback(callback)
+        self.manager.unregister_update_callback(callback)
+        self.manager.notify_update()
+        self.assertEqual(calls, [])
+
+    def test_bound_method_is_held_weakly(self):
+        widget = _Widget()
+        self.manager.register_update_callback(widget.update_texts)
+        self.manager.notify_update()
+        self.assertEqual(widget.calls, 1)
+
+        del widget
+        gc.collect()
+        self.assertEqual(len(self.manager.update_callbacks), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()